@@ -1,12 +1,15 @@
 import streamlit as st
 import pandas as pd
 import re
+import functools
+import time
 from datetime import datetime
 import io
-import base64
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser as HTMLParser
 import json
+from concurrent.futures import ThreadPoolExecutor, wait
 from openai import OpenAI
 
 # --- Page Config ---
@@ -18,33 +21,150 @@ st.set_page_config(
 
 # --- Data Cleaning Functions ---
 
+def to_clean_text(value):
+    """Coerce a cell to a stripped string, returning None for NA or blank values."""
+    if pd.isna(value):
+        return None
+    text = str(value).strip()
+    return text if text else None
+
+
+def apply_cleaner(series, cleaner):
+    """Apply a cell cleaner to only the non-blank cells of a column.
+    
+    NA/blank detection and string coercion run once over the whole column, so the
+    Python-level cleaner is only called for cells that actually hold text, and only
+    once per distinct value (schedules repeat courses, cities and states a lot).
+    """
+    text = series.astype('string').str.strip()
+    valid = (text.notna() & text.ne('')).to_numpy(dtype=bool)
+    cleaned = pd.Series([None] * len(series), index=series.index, dtype=object)
+    values = text[valid].astype(object)
+    results = {value: cleaner(value) for value in values.unique()}
+    cleaned[valid] = [results[value] for value in values]
+    return cleaned
+
+
+def is_blank(series):
+    """Boolean mask of NA or whitespace-only cells in a column."""
+    return series.astype('string').str.strip().fillna('').eq('').astype(bool)
+
+
+# Numeric M/D/Y or M-D-Y date anywhere in a string (fallback when no known format matches)
+_RE_NUMERIC_DATE = re.compile(r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})')
+
+
+# Common date formats to try
+_DATE_FORMATS = (
+    '%m/%d/%Y', '%m/%d/%y', '%m-%d-%Y', '%m-%d-%y',
+    '%Y-%m-%d', '%Y/%m/%d',
+    '%B %d, %Y', '%b %d, %Y', '%B %d %Y', '%b %d %Y',
+    '%d %B %Y', '%d %b %Y', '%d %B, %Y', '%d %b, %Y',
+    '%B %d', '%b %d',  # Without year
+)
+
+# Date string shape -> the only formats above that can match it (in the same order),
+# so strptime isn't called (and doesn't raise) for formats that cannot fit.
+# One alternation classifies the shape; the first alternative that fits the whole string wins.
+_RE_DATE_SHAPE = re.compile(
+    r'(?P<slash>\d+/\d+/\d+)|(?P<dash>\d+-\d+-\d+)|(?P<month_first>[A-Za-z].*)|(?P<day_first>\d.*[A-Za-z].*)',
+    re.S
+)
+_DATE_FORMATS_BY_SHAPE = {
+    'slash': ('%m/%d/%Y', '%m/%d/%y', '%Y/%m/%d'),
+    'dash': ('%m-%d-%Y', '%m-%d-%y', '%Y-%m-%d'),
+    'month_first': ('%B %d, %Y', '%b %d, %Y', '%B %d %Y', '%b %d %Y', '%B %d', '%b %d'),
+    'day_first': ('%d %B %Y', '%d %b %Y', '%d %B, %Y', '%d %b, %Y'),
+}
+
+
+# English month names and abbreviations -> month number, for the strptime-free fast path
+_MONTHS = {
+    name.lower(): number
+    for number, names in enumerate(
+        (('January', 'Jan'), ('February', 'Feb'), ('March', 'Mar'), ('April', 'Apr'),
+         ('May',), ('June', 'Jun'), ('July', 'Jul'), ('August', 'Aug'),
+         ('September', 'Sep'), ('October', 'Oct'), ('November', 'Nov'), ('December', 'Dec')),
+        start=1,
+    )
+    for name in names
+}
+
+# The shapes AI output and association sites use most: 2026-07-20, "Jan 13", "June 3, 2026".
+# One alternation; the named groups say which shape matched and hold its parts.
+_RE_COMMON_DATE = re.compile(
+    r'(?P<iso_year>\d{4})-(?P<iso_month>\d{2})-(?P<iso_day>\d{2})'
+    r'|(?P<month_name>[A-Za-z]+) (?P<day>\d{1,2})(?:,? (?P<year>\d{4}))?'
+)
+
+
+def _parse_common_date(date_str):
+    """Parse the most common date shapes directly, or return None to fall back to strptime.
+    
+    Only handles inputs strptime would read the same way; anything unusual (odd
+    spacing, years up to 1900, impossible days) is left to the format loop.
+    """
+    match = _RE_COMMON_DATE.fullmatch(date_str)
+    if not match:
+        return None
+    
+    if match['iso_year']:
+        year, month, day = int(match['iso_year']), int(match['iso_month']), int(match['iso_day'])
+    else:
+        month = _MONTHS.get(match['month_name'].lower())
+        if month is None:
+            return None
+        day = int(match['day'])
+        if match['year'] is None:
+            # No year: same roll-forward as the strptime path (this year, or next if already past)
+            try:
+                datetime(1900, month, day)
+            except ValueError:
+                return None
+            current_year = datetime.now().year
+            parsed_date = datetime(current_year, month, day)
+            if parsed_date < datetime.now():
+                parsed_date = parsed_date.replace(year=current_year + 1)
+            return parsed_date.strftime('%Y-%m-%d')
+        year = int(match['year'])
+    
+    if year <= 1900:
+        return None
+    try:
+        return datetime(year, month, day).strftime('%Y-%m-%d')
+    except ValueError:
+        return None
+
+
+def _candidate_date_formats(date_str):
+    """Return the date formats worth trying for a stripped date string."""
+    shape = _RE_DATE_SHAPE.fullmatch(date_str)
+    return _DATE_FORMATS_BY_SHAPE[shape.lastgroup] if shape else _DATE_FORMATS
+
+
 def clean_date(date_str):
     """Clean and standardize date formats to YYYY-MM-DD."""
-    if pd.isna(date_str) or str(date_str).strip() == '':
+    date_str = to_clean_text(date_str)
+    if date_str is None:
         return None
     
-    date_str = str(date_str).strip()
+    lowered = date_str.lower()
     
     # Handle TBD/TBA
-    if date_str.lower() in ['tbd', 'tba', 'n/a', 'na']:
+    if lowered in ('tbd', 'tba', 'n/a', 'na'):
         return 'TBD'
     
     # Handle date ranges (take the first date)
     if ' - ' in date_str:
-        date_str = date_str.split(' - ')[0].strip()
-    elif ' to ' in date_str.lower():
-        date_str = date_str.lower().split(' to ')[0].strip()
-    
-    # Common date formats to try
-    date_formats = [
-        '%m/%d/%Y', '%m/%d/%y', '%m-%d-%Y', '%m-%d-%y',
-        '%Y-%m-%d', '%Y/%m/%d',
-        '%B %d, %Y', '%b %d, %Y', '%B %d %Y', '%b %d %Y',
-        '%d %B %Y', '%d %b %Y', '%d %B, %Y', '%d %b, %Y',
-        '%B %d', '%b %d',  # Without year
-    ]
-    
-    for fmt in date_formats:
+        date_str = date_str.split(' - ', 1)[0].strip()
+    elif ' to ' in lowered:
+        date_str = lowered.split(' to ', 1)[0].strip()
+    
+    parsed = _parse_common_date(date_str)
+    if parsed:
+        return parsed
+    
+    for fmt in _candidate_date_formats(date_str):
         try:
             parsed_date = datetime.strptime(date_str, fmt)
             # If year is missing or very old, assume current/next year
@@ -67,8 +187,7 @@ def clean_date(date_str):
             continue
     
     # Try regex extraction as fallback
-    date_pattern = r'(\d{1,2})[/-](\d{1,2})[/-](\d{2,4})'
-    match = re.search(date_pattern, date_str)
+    match = _RE_NUMERIC_DATE.search(date_str)
     if match:
         month, day, year = match.groups()
         if len(year) == 2:
@@ -82,19 +201,25 @@ def clean_date(date_str):
     return date_str
 
 
+# Status markers and link-label noise stripped from tournament names, applied in order
+_NAME_NOISE_PATTERNS = (
+    re.compile(r'\s?\*FULL\*$', re.I),
+    re.compile(r'\s?\(FULL\)$', re.I),
+    re.compile(r'\s?\[FULL\]$', re.I),
+    re.compile(r'^(?:View\s)?(?:Leaderboard|Results|Details|Info|Tee Times|Register|Enter)\s*[-–]?\s*', re.I),
+    re.compile(r'\s*[-–]?\s*(?:Leaderboard|Results|Details|Info|Tee Times|Register|Enter)$', re.I),
+)
+
+
 def clean_name(name_str):
     """Clean tournament names."""
-    if pd.isna(name_str) or str(name_str).strip() == '':
+    name_str = to_clean_text(name_str)
+    if name_str is None:
         return None
     
-    name_str = str(name_str).strip()
-    
     # Remove common suffixes/prefixes
-    name_str = re.sub(r'\s?\*FULL\*$', '', name_str, flags=re.I)
-    name_str = re.sub(r'\s?\(FULL\)$', '', name_str, flags=re.I)
-    name_str = re.sub(r'\s?\[FULL\]$', '', name_str, flags=re.I)
-    name_str = re.sub(r'^(?:View\s)?(?:Leaderboard|Results|Details|Info|Tee Times|Register|Enter)\s*[-–]?\s*', '', name_str, flags=re.I)
-    name_str = re.sub(r'\s*[-–]?\s*(?:Leaderboard|Results|Details|Info|Tee Times|Register|Enter)$', '', name_str, flags=re.I)
+    for pattern in _NAME_NOISE_PATTERNS:
+        name_str = pattern.sub('', name_str)
     
     # Remove extra whitespace
     name_str = ' '.join(name_str.split())
@@ -102,86 +227,120 @@ def clean_name(name_str):
     return name_str.strip() if name_str.strip() else None
 
 
+# Golf/Country Club abbreviations left mis-cased by the source, as (pattern, replacement) applied in order
+_COURSE_ABBREVIATIONS = (
+    (re.compile(r'\bGc\b'), 'GC'),
+    (re.compile(r'\bCc\b'), 'CC'),
+    (re.compile(r'\bG\.c\.\b', re.I), 'GC'),
+    (re.compile(r'\bC\.c\.\b', re.I), 'CC'),
+)
+
+
 def clean_course(course_str):
     """Clean golf course names."""
-    if pd.isna(course_str) or str(course_str).strip() == '':
+    course_str = to_clean_text(course_str)
+    if course_str is None:
         return None
     
-    course_str = str(course_str).strip()
-    
     # Remove extra whitespace
     course_str = ' '.join(course_str.split())
     
     # Fix common abbreviations
-    course_str = re.sub(r'\bGc\b', 'GC', course_str)
-    course_str = re.sub(r'\bCc\b', 'CC', course_str)
-    course_str = re.sub(r'\bG\.c\.\b', 'GC', course_str, flags=re.I)
-    course_str = re.sub(r'\bC\.c\.\b', 'CC', course_str, flags=re.I)
+    for pattern, replacement in _COURSE_ABBREVIATIONS:
+        course_str = pattern.sub(replacement, course_str)
     
     return course_str.strip() if course_str.strip() else None
 
 
-def extract_category(row):
+# Category/gender labels by keyword group, highest priority first (shared with the URL classifiers)
+_CATEGORY_PRIORITY = (
+    ('super_senior', 'Super-Senior'),
+    ('senior', 'Senior'),
+    ('junior', 'Junior'),
+    ('amateur', 'Amateur'),
+    ('open', 'Open'),
+)
+_GENDER_PRIORITY = (
+    ('women', "Women's"),
+    ('men', "Men's"),
+    ('mixed', "Mixed"),
+)
+
+# Whole-word keywords in tournament names/columns, grouped like the URL patterns further down
+_RE_CATEGORY = re.compile(
+    r'(?=(?P<super_senior>\bsuper.?senior\b)|(?P<senior>\bsenior\b|\bsr\.?\b)'
+    r'|(?P<junior>\bjunior\b|\bjr\.?\b|\byouth\b|\bboys\b|\bgirls\b)|(?P<amateur>\bamateur\b|\bam\b)'
+    r'|(?P<open>\bopen\b|\bchampionship\b|\bfour.?ball\b|\bmatch.?play\b|\bmid.?amateur\b|\bparent.?child\b))'
+)
+_RE_GENDER = re.compile(
+    r'(?=(?P<women>\bwomen\'?s\b|\bladies\b|\bfemale\b|\bgirls\b|\blpga\b)|(?P<men>\bmen\'?s\b|\bmale\b|\bboys\b)'
+    r'|(?P<mixed>\bparent.?child\b|\bfamily\b|\bmixed\b))'
+)
+
+
+def first_keyword_match(pattern, text, priority):
+    """Return the label of the highest-priority keyword group found anywhere in text."""
+    found = {match.lastgroup for match in pattern.finditer(text)}
+    for group, label in priority:
+        if group in found:
+            return label
+    return None
+
+
+def _keyword_text(df, extra_columns):
+    """Lower-cased name plus each non-blank extra column, space-joined per row, for keyword matching."""
+    text = df['name'].astype('string').str.lower().fillna('')
+    for col in extra_columns:
+        extra = df[col].astype('string').str.strip().str.lower()
+        present = (extra.notna() & extra.ne('')).fillna(False).astype(bool)
+        text = text.mask(present, text + ' ' + extra)
+    return text
+
+
+def _classify_text(text, pattern, priority, default):
+    """Label each row's keyword text, running the regex once per distinct text."""
+    labels = {value: first_keyword_match(pattern, value, priority) or default for value in text.unique()}
+    return pd.Series([labels[value] for value in text], index=text.index, dtype=object)
+
+
+def extract_category_series(df):
     """Extract tournament category (Senior, Amateur, Junior, All) from name or dedicated column."""
-    # Get text to analyze
-    name = str(row.get('name', '')).lower() if pd.notna(row.get('name')) else ""
-    
-    # Check if category column exists and has a value
-    if 'category' in row.index and pd.notna(row.get('category')) and str(row.get('category')).strip():
-        cat = str(row['category']).strip().lower()
-        name = name + " " + cat  # Combine for analysis
-    
-    # Determine category based on keywords
-    # Check for Super-Senior first (subset of Senior)
-    if re.search(r'\bsuper.?senior\b', name):
-        return 'Super-Senior'
-    elif re.search(r'\bsenior\b|\bsr\.?\b', name):
-        return 'Senior'
-    elif re.search(r'\bjunior\b|\bjr\.?\b|\byouth\b|\bboys\b|\bgirls\b', name):
-        return 'Junior'
-    elif re.search(r'\bamateur\b|\bam\b', name):
-        return 'Amateur'
-    elif re.search(r'\bopen\b|\bchampionship\b|\bfour.?ball\b|\bmatch.?play\b|\bmid.?amateur\b|\bparent.?child\b', name):
-        return 'Open'
-    
-    return 'All'  # Default to 'All' if no specific category detected
-
-
-def extract_gender(row):
+    # Super-Senior outranks Senior, etc.; default to 'All' if no specific category detected
+    return _classify_text(_keyword_text(df, ['category']), _RE_CATEGORY, _CATEGORY_PRIORITY, 'All')
+
+
+def extract_gender_series(df):
     """Extract gender (Men's, Women's) from name or dedicated column."""
-    # Get text to analyze
-    name = str(row.get('name', '')).lower() if pd.notna(row.get('name')) else ""
-    
-    # Check if category/gender column exists and has a value
-    if 'category' in row.index and pd.notna(row.get('category')) and str(row.get('category')).strip():
-        cat = str(row['category']).strip().lower()
-        name = name + " " + cat
-    if 'gender' in row.index and pd.notna(row.get('gender')) and str(row.get('gender')).strip():
-        gender = str(row['gender']).strip().lower()
-        name = name + " " + gender
-    
-    # Determine gender based on keywords
-    if re.search(r'\bwomen\'?s\b|\bladies\b|\bfemale\b|\bgirls\b|\blpga\b', name):
-        return "Women's"
-    elif re.search(r'\bmen\'?s\b|\bmale\b|\bboys\b', name):
-        return "Men's"
-    elif re.search(r'\bparent.?child\b|\bfamily\b|\bmixed\b', name):
-        return "Mixed"
-    
-    return "Men's"  # Default to Men's if no gender detected
+    # Default to Men's if no gender detected
+    return _classify_text(_keyword_text(df, ['category', 'gender']), _RE_GENDER, _GENDER_PRIORITY, "Men's")
+
+
+# Trailing ", ST 12345", ", ST" and " 12345" location suffixes accidentally included with a city
+_RE_CITY_STATE_ZIP_SUFFIX = re.compile(r',\s*[A-Z]{2}\s*\d{5}(?:-\d{4})?$')
+_RE_CITY_STATE_SUFFIX = re.compile(r',\s*[A-Z]{2}$')
+_RE_CITY_ZIP_SUFFIX = re.compile(r'\s+\d{5}(?:-\d{4})?$')
+
+# Abbreviated city prefixes spelled out after title-casing, as (pattern, replacement)
+_CITY_ABBREVIATIONS = (
+    (re.compile(r'\bSt\.\s'), 'Saint '),
+    (re.compile(r'\bFt\.\s'), 'Fort '),
+    (re.compile(r'\bMt\.\s'), 'Mount '),
+)
 
 
 def clean_city(city_str):
     """Clean city names."""
-    if pd.isna(city_str) or str(city_str).strip() == '':
+    city_str = to_clean_text(city_str)
+    if city_str is None:
         return None
     
-    city_str = str(city_str).strip()
-    
     # Remove state/zip if accidentally included with city
-    city_str = re.sub(r',\s*[A-Z]{2}\s*\d{5}(?:-\d{4})?$', '', city_str)
-    city_str = re.sub(r',\s*[A-Z]{2}$', '', city_str)
-    city_str = re.sub(r'\s+\d{5}(?:-\d{4})?$', '', city_str)
+    # (both state patterns need a comma and the zip pattern a trailing digit, so most cities skip the regexes)
+    if ',' in city_str:
+        city_str = _RE_CITY_STATE_ZIP_SUFFIX.sub('', city_str)
+        city_str = _RE_CITY_STATE_SUFFIX.sub('', city_str)
+    if city_str[-1:].isdigit():
+        city_str = _RE_CITY_ZIP_SUFFIX.sub('', city_str)
     
     # Remove extra whitespace
     city_str = ' '.join(city_str.split())
@@ -190,19 +349,20 @@ def clean_city(city_str):
     city_str = city_str.title()
     
     # Fix common abbreviations
-    city_str = re.sub(r'\bSt\.\s', 'Saint ', city_str)
-    city_str = re.sub(r'\bFt\.\s', 'Fort ', city_str)
-    city_str = re.sub(r'\bMt\.\s', 'Mount ', city_str)
+    if '.' in city_str:
+        for pattern, replacement in _CITY_ABBREVIATIONS:
+            city_str = pattern.sub(replacement, city_str)
     
     return city_str.strip() if city_str.strip() else None
 
 
 def clean_state(state_str):
     """Clean and standardize state abbreviations."""
-    if pd.isna(state_str) or str(state_str).strip() == '':
+    state_str = to_clean_text(state_str)
+    if state_str is None:
         return None
     
-    state_str = str(state_str).strip().upper()
+    state_str = state_str.upper()
     
     # If already a valid 2-letter state code, return it
     valid_states = {
@@ -245,27 +405,19 @@ def clean_state(state_str):
     return state_str if len(state_str) == 2 else None
 
 
-def clean_zip(zip_str):
-    """Clean ZIP codes to 5-digit format."""
-    if pd.isna(zip_str) or str(zip_str).strip() == '':
-        return None
-    
-    zip_str = str(zip_str).strip()
-    
+def clean_zip_series(zip_series):
+    """Clean a column of ZIP codes to 5-digit format."""
     # Handle float conversion (e.g., 12345.0)
-    if '.' in zip_str:
-        zip_str = zip_str.split('.')[0]
+    zips = zip_series.astype('string').str.strip().str.split('.', n=1).str[0]
     
     # Extract 5-digit ZIP code
-    zip_match = re.search(r'(\d{5})(?:-\d{4})?', zip_str)
-    if zip_match:
-        return zip_match.group(1)
+    cleaned = zips.str.extract(r'(\d{5})', expand=False)
     
     # If it's just digits but less than 5, pad with zeros
-    if zip_str.isdigit() and len(zip_str) < 5:
-        return zip_str.zfill(5)
+    short = zips.str.fullmatch(r'\d{1,4}').fillna(False).astype(bool)
+    cleaned = cleaned.mask(short, zips.str.zfill(5))
     
-    return None
+    return cleaned.astype(object).where(cleaned.notna(), None)
 
 
 def find_column_match(target, columns):
@@ -329,28 +481,28 @@ def clean_tournament_data(df):
     
     # Apply cleaning functions
     if 'date' in cleaned_df.columns:
-        cleaned_df['date'] = cleaned_df['date'].apply(clean_date)
+        cleaned_df['date'] = apply_cleaner(cleaned_df['date'], clean_date)
     
     if 'name' in cleaned_df.columns:
-        cleaned_df['name'] = cleaned_df['name'].apply(clean_name)
+        cleaned_df['name'] = apply_cleaner(cleaned_df['name'], clean_name)
     
     if 'course' in cleaned_df.columns:
-        cleaned_df['course'] = cleaned_df['course'].apply(clean_course)
+        cleaned_df['course'] = apply_cleaner(cleaned_df['course'], clean_course)
     
     if 'city' in cleaned_df.columns:
-        cleaned_df['city'] = cleaned_df['city'].apply(clean_city)
+        cleaned_df['city'] = apply_cleaner(cleaned_df['city'], clean_city)
     
     if 'state' in cleaned_df.columns:
-        cleaned_df['state'] = cleaned_df['state'].apply(clean_state)
+        cleaned_df['state'] = apply_cleaner(cleaned_df['state'], clean_state)
     
     if 'zip' in cleaned_df.columns:
-        cleaned_df['zip'] = cleaned_df['zip'].apply(clean_zip)
+        cleaned_df['zip'] = clean_zip_series(cleaned_df['zip'])
     
     # Extract category (Senior, Amateur, Junior, Open, All)
-    cleaned_df['category'] = cleaned_df.apply(extract_category, axis=1)
+    cleaned_df['category'] = extract_category_series(cleaned_df)
     
-    # Extract gender (Men's, Women's, Mixed)
-    cleaned_df['gender'] = cleaned_df.apply(extract_gender, axis=1)
+    # Extract gender (Men's, Women's, Mixed) - reads the category extracted just above
+    cleaned_df['gender'] = extract_gender_series(cleaned_df)
     
     # Reorder columns
     final_columns = ['date', 'name', 'course', 'category', 'gender', 'city', 'state', 'zip']
@@ -363,6 +515,142 @@ def clean_tournament_data(df):
     return cleaned_df
 
 
+# URL keyword patterns: one alternation per classifier. The lookahead makes finditer test
+# every position, so overlapping keywords (e.g. "female" and "male") are all reported.
+_RE_URL_CATEGORY = re.compile(
+    r'(?=(?P<super_senior>super-?senior)|(?P<senior>senior|sr-)|(?P<junior>junior|jr-|youth|boys|girls)'
+    r'|(?P<amateur>amateur|am-)|(?P<open>open|championship))'
+)
+_RE_URL_GENDER = re.compile(
+    r'(?=(?P<women>women|ladies|female|lpga|girls)|(?P<men>men|male|boys)|(?P<mixed>mixed|parent-child|family))'
+)
+
+
+# Map of URL patterns to state abbreviations
+# Priority order: specific domain patterns first, then general patterns
+_URL_STATE_PATTERNS = (
+    # Specific state golf association domains (check these first)
+    ('fsga.org', 'FL'),      # Florida State Golf Association
+    ('txga.org', 'TX'),      # Texas Golf Association
+    ('tga.org', 'TX'),       # Texas Golf Association (alternate)
+    ('gsga.org', 'GA'),      # Georgia State Golf Association
+    ('scga.org', 'CA'),      # Southern California Golf Association
+    ('ncga.org', 'CA'),      # Northern California Golf Association
+    ('azga.org', 'AZ'),      # Arizona Golf Association
+    ('aga.org', 'AZ'),       # Arizona Golf Association (alternate)
+    ('cga.org', 'CO'),       # Colorado Golf Association
+    ('wsga.org', 'WA'),      # Washington State Golf Association
+    ('oga.org', 'OR'),       # Oregon Golf Association
+    ('mga.org', 'MN'),       # Minnesota Golf Association
+    ('gam.org', 'MI'),       # Golf Association of Michigan
+    ('cdga.org', 'IL'),      # Chicago District Golf Association
+    ('iga.org', 'IL'),       # Illinois Golf Association
+    ('njsga.org', 'NJ'),     # New Jersey State Golf Association
+    ('nysga.org', 'NY'),     # New York State Golf Association
+    ('mga.org', 'NY'),       # Metropolitan Golf Association (NY area)
+    ('vsga.org', 'VA'),      # Virginia State Golf Association
+    ('carolinasgolf.org', 'NC'),  # Carolinas Golf Association
+    ('tennessegolf.org', 'TN'),   # Tennessee Golf Association
+    ('ohiogolf.org', 'OH'),       # Ohio Golf Association
+    ('indianagolf.org', 'IN'),    # Indiana Golf Association
+    ('kygolf.org', 'KY'),         # Kentucky Golf Association
+    ('missourigolf.org', 'MO'),   # Missouri Golf Association
+    ('iowagolf.org', 'IA'),       # Iowa Golf Association
+    ('nebgolf.org', 'NE'),        # Nebraska Golf Association
+    ('kansasgolf.org', 'KS'),     # Kansas Golf Association
+    ('okgolf.org', 'OK'),         # Oklahoma Golf Association
+    ('arkansasgolf.org', 'AR'),   # Arkansas Golf Association
+    ('msgolf.org', 'MS'),         # Mississippi Golf Association
+    ('algolf.org', 'AL'),         # Alabama Golf Association
+    ('lgagolf.org', 'LA'),        # Louisiana Golf Association
+    ('snga.org', 'NV'),           # Southern Nevada Golf Association
+    ('utahgolf.org', 'UT'),       # Utah Golf Association
+    ('nmga.org', 'NM'),           # New Mexico Golf Association
+    ('hsgagolf.org', 'HI'),       # Hawaii State Golf Association
+    ('agagolf.org', 'AK'),        # Alaska Golf Association
+    ('megagolf.org', 'ME'),       # Maine Golf Association
+    ('vtga.org', 'VT'),           # Vermont Golf Association
+    ('nhga.org', 'NH'),           # New Hampshire Golf Association
+    ('riga.org', 'RI'),           # Rhode Island Golf Association
+    ('dsga.org', 'DE'),           # Delaware State Golf Association
+    ('wvga.org', 'WV'),           # West Virginia Golf Association
+    ('msgagolf.org', 'MT'),       # Montana State Golf Association
+    ('theiga.org', 'ID'),         # Idaho Golf Association
+    ('wga.org', 'WY'),            # Wyoming Golf Association
+    ('ndga.org', 'ND'),           # North Dakota Golf Association
+    ('sdga.org', 'SD'),           # South Dakota Golf Association
+    ('wiscgolf.org', 'WI'),       # Wisconsin State Golf Association
+    ('wpga.org', 'WI'),           # Wisconsin PGA
+    ('massgolf.org', 'MA'),       # Massachusetts Golf Association
+    ('ctga.org', 'CT'),           # Connecticut Golf Association
+    ('mdga.org', 'MD'),           # Maryland State Golf Association
+    ('pagolf.org', 'PA'),         # Pennsylvania Golf Association
+    
+    # State name patterns in URL
+    ('florida', 'FL'),
+    ('texas', 'TX'),
+    ('georgia', 'GA'),
+    ('california', 'CA'),
+    ('arizona', 'AZ'),
+    ('colorado', 'CO'),
+    ('newyork', 'NY'),
+    ('new-york', 'NY'),
+    ('newjersey', 'NJ'),
+    ('new-jersey', 'NJ'),
+    ('northcarolina', 'NC'),
+    ('north-carolina', 'NC'),
+    ('southcarolina', 'SC'),
+    ('south-carolina', 'SC'),
+    ('virginia', 'VA'),
+    ('ohio', 'OH'),
+    ('michigan', 'MI'),
+    ('illinois', 'IL'),
+    ('pennsylvania', 'PA'),
+    ('massachusetts', 'MA'),
+    ('washington', 'WA'),
+    ('oregon', 'OR'),
+    ('nevada', 'NV'),
+    ('tennessee', 'TN'),
+    ('alabama', 'AL'),
+    ('louisiana', 'LA'),
+    ('minnesota', 'MN'),
+    ('wisconsin', 'WI'),
+    ('iowa', 'IA'),
+    ('missouri', 'MO'),
+    ('kansas', 'KS'),
+    ('oklahoma', 'OK'),
+    ('arkansas', 'AR'),
+    ('mississippi', 'MS'),
+    ('kentucky', 'KY'),
+    ('indiana', 'IN'),
+    ('maryland', 'MD'),
+    ('connecticut', 'CT'),
+    ('utah', 'UT'),
+    ('newmexico', 'NM'),
+    ('new-mexico', 'NM'),
+    ('hawaii', 'HI'),
+    ('alaska', 'AK'),
+    ('maine', 'ME'),
+    ('vermont', 'VT'),
+    ('newhampshire', 'NH'),
+    ('new-hampshire', 'NH'),
+    ('rhodeisland', 'RI'),
+    ('rhode-island', 'RI'),
+    ('delaware', 'DE'),
+    ('westvirginia', 'WV'),
+    ('west-virginia', 'WV'),
+    ('montana', 'MT'),
+    ('idaho', 'ID'),
+    ('wyoming', 'WY'),
+    ('northdakota', 'ND'),
+    ('north-dakota', 'ND'),
+    ('southdakota', 'SD'),
+    ('south-dakota', 'SD'),
+    ('nebraska', 'NE'),
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def extract_category_from_url(url):
     """Extract tournament category (Senior, Amateur, Junior, Open, All) from URL patterns."""
     if not url or pd.isna(url):
@@ -371,20 +659,10 @@ def extract_category_from_url(url):
     url_lower = str(url).lower()
     
     # Check for category indicators in URL
-    if any(keyword in url_lower for keyword in ['super-senior', 'supersenior']):
-        return 'Super-Senior'
-    elif any(keyword in url_lower for keyword in ['senior', 'seniors', 'sr-']):
-        return 'Senior'
-    elif any(keyword in url_lower for keyword in ['junior', 'juniors', 'jr-', 'youth', 'boys', 'girls']):
-        return 'Junior'
-    elif any(keyword in url_lower for keyword in ['amateur', 'am-']):
-        return 'Amateur'
-    elif any(keyword in url_lower for keyword in ['open', 'championship']):
-        return 'Open'
-    
-    return None
+    return first_keyword_match(_RE_URL_CATEGORY, url_lower, _CATEGORY_PRIORITY)
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_gender_from_url(url):
     """Extract gender (Men's, Women's, Mixed) from URL patterns."""
     if not url or pd.isna(url):
@@ -393,16 +671,10 @@ def extract_gender_from_url(url):
     url_lower = str(url).lower()
     
     # Check for gender indicators in URL
-    if any(keyword in url_lower for keyword in ['women', 'ladies', 'female', 'lpga', 'womens', 'girls']):
-        return "Women's"
-    elif any(keyword in url_lower for keyword in ['men', 'mens', 'male', 'boys']):
-        return "Men's"
-    elif any(keyword in url_lower for keyword in ['mixed', 'parent-child', 'family']):
-        return "Mixed"
-    
-    return None
+    return first_keyword_match(_RE_URL_GENDER, url_lower, _GENDER_PRIORITY)
 
 
+@functools.lru_cache(maxsize=1024)
 def extract_state_from_url(url):
     """Extract state from URL patterns."""
     if not url or pd.isna(url):
@@ -410,144 +682,22 @@ def extract_state_from_url(url):
     
     url_lower = str(url).lower()
     
-    # Map of URL patterns to state abbreviations
-    # Priority order: specific domain patterns first, then general patterns
-    state_patterns = [
-        # Specific state golf association domains (check these first)
-        ('fsga.org', 'FL'),      # Florida State Golf Association
-        ('txga.org', 'TX'),      # Texas Golf Association
-        ('tga.org', 'TX'),       # Texas Golf Association (alternate)
-        ('gsga.org', 'GA'),      # Georgia State Golf Association
-        ('scga.org', 'CA'),      # Southern California Golf Association
-        ('ncga.org', 'CA'),      # Northern California Golf Association
-        ('azga.org', 'AZ'),      # Arizona Golf Association
-        ('aga.org', 'AZ'),       # Arizona Golf Association (alternate)
-        ('cga.org', 'CO'),       # Colorado Golf Association
-        ('wsga.org', 'WA'),      # Washington State Golf Association
-        ('oga.org', 'OR'),       # Oregon Golf Association
-        ('mga.org', 'MN'),       # Minnesota Golf Association
-        ('gam.org', 'MI'),       # Golf Association of Michigan
-        ('cdga.org', 'IL'),      # Chicago District Golf Association
-        ('iga.org', 'IL'),       # Illinois Golf Association
-        ('njsga.org', 'NJ'),     # New Jersey State Golf Association
-        ('nysga.org', 'NY'),     # New York State Golf Association
-        ('mga.org', 'NY'),       # Metropolitan Golf Association (NY area)
-        ('vsga.org', 'VA'),      # Virginia State Golf Association
-        ('carolinasgolf.org', 'NC'),  # Carolinas Golf Association
-        ('tennessegolf.org', 'TN'),   # Tennessee Golf Association
-        ('ohiogolf.org', 'OH'),       # Ohio Golf Association
-        ('indianagolf.org', 'IN'),    # Indiana Golf Association
-        ('kygolf.org', 'KY'),         # Kentucky Golf Association
-        ('missourigolf.org', 'MO'),   # Missouri Golf Association
-        ('iowagolf.org', 'IA'),       # Iowa Golf Association
-        ('nebgolf.org', 'NE'),        # Nebraska Golf Association
-        ('kansasgolf.org', 'KS'),     # Kansas Golf Association
-        ('okgolf.org', 'OK'),         # Oklahoma Golf Association
-        ('arkansasgolf.org', 'AR'),   # Arkansas Golf Association
-        ('msgolf.org', 'MS'),         # Mississippi Golf Association
-        ('algolf.org', 'AL'),         # Alabama Golf Association
-        ('lgagolf.org', 'LA'),        # Louisiana Golf Association
-        ('snga.org', 'NV'),           # Southern Nevada Golf Association
-        ('utahgolf.org', 'UT'),       # Utah Golf Association
-        ('nmga.org', 'NM'),           # New Mexico Golf Association
-        ('hsgagolf.org', 'HI'),       # Hawaii State Golf Association
-        ('agagolf.org', 'AK'),        # Alaska Golf Association
-        ('megagolf.org', 'ME'),       # Maine Golf Association
-        ('vtga.org', 'VT'),           # Vermont Golf Association
-        ('nhga.org', 'NH'),           # New Hampshire Golf Association
-        ('riga.org', 'RI'),           # Rhode Island Golf Association
-        ('dsga.org', 'DE'),           # Delaware State Golf Association
-        ('wvga.org', 'WV'),           # West Virginia Golf Association
-        ('msgagolf.org', 'MT'),       # Montana State Golf Association
-        ('theiga.org', 'ID'),         # Idaho Golf Association
-        ('wga.org', 'WY'),            # Wyoming Golf Association
-        ('ndga.org', 'ND'),           # North Dakota Golf Association
-        ('sdga.org', 'SD'),           # South Dakota Golf Association
-        ('wiscgolf.org', 'WI'),       # Wisconsin State Golf Association
-        ('wpga.org', 'WI'),           # Wisconsin PGA
-        ('massgolf.org', 'MA'),       # Massachusetts Golf Association
-        ('ctga.org', 'CT'),           # Connecticut Golf Association
-        ('mdga.org', 'MD'),           # Maryland State Golf Association
-        ('pagolf.org', 'PA'),         # Pennsylvania Golf Association
-        
-        # State name patterns in URL
-        ('florida', 'FL'),
-        ('texas', 'TX'),
-        ('georgia', 'GA'),
-        ('california', 'CA'),
-        ('arizona', 'AZ'),
-        ('colorado', 'CO'),
-        ('newyork', 'NY'),
-        ('new-york', 'NY'),
-        ('newjersey', 'NJ'),
-        ('new-jersey', 'NJ'),
-        ('northcarolina', 'NC'),
-        ('north-carolina', 'NC'),
-        ('southcarolina', 'SC'),
-        ('south-carolina', 'SC'),
-        ('virginia', 'VA'),
-        ('ohio', 'OH'),
-        ('michigan', 'MI'),
-        ('illinois', 'IL'),
-        ('pennsylvania', 'PA'),
-        ('massachusetts', 'MA'),
-        ('washington', 'WA'),
-        ('oregon', 'OR'),
-        ('nevada', 'NV'),
-        ('tennessee', 'TN'),
-        ('alabama', 'AL'),
-        ('louisiana', 'LA'),
-        ('minnesota', 'MN'),
-        ('wisconsin', 'WI'),
-        ('iowa', 'IA'),
-        ('missouri', 'MO'),
-        ('kansas', 'KS'),
-        ('oklahoma', 'OK'),
-        ('arkansas', 'AR'),
-        ('mississippi', 'MS'),
-        ('kentucky', 'KY'),
-        ('indiana', 'IN'),
-        ('maryland', 'MD'),
-        ('connecticut', 'CT'),
-        ('utah', 'UT'),
-        ('newmexico', 'NM'),
-        ('new-mexico', 'NM'),
-        ('hawaii', 'HI'),
-        ('alaska', 'AK'),
-        ('maine', 'ME'),
-        ('vermont', 'VT'),
-        ('newhampshire', 'NH'),
-        ('new-hampshire', 'NH'),
-        ('rhodeisland', 'RI'),
-        ('rhode-island', 'RI'),
-        ('delaware', 'DE'),
-        ('westvirginia', 'WV'),
-        ('west-virginia', 'WV'),
-        ('montana', 'MT'),
-        ('idaho', 'ID'),
-        ('wyoming', 'WY'),
-        ('northdakota', 'ND'),
-        ('north-dakota', 'ND'),
-        ('southdakota', 'SD'),
-        ('south-dakota', 'SD'),
-        ('nebraska', 'NE'),
-    ]
-    
-    for pattern, state in state_patterns:
+    for pattern, state in _URL_STATE_PATTERNS:
         if pattern in url_lower:
             return state
     
     return None
 
 
+# A standalone 20xx year of 2025 or earlier (2000-2025)
+_RE_OLD_YEAR = re.compile(r'\b(?:20[01]\d|202[0-5])\b')
+
+
 def filter_old_dates(df, raw_text_content=None):
     """Filter out tournaments with entries_close_year of 2025 or earlier."""
     if df is None or len(df) == 0:
         return df
     
-    df = df.copy()
-    rows_to_keep = []
-    
     # Find the entries_close_year column (case insensitive)
     ec_year_col = None
     for col in df.columns:
@@ -555,39 +705,29 @@ def filter_old_dates(df, raw_text_content=None):
             ec_year_col = col
             break
     
-    for idx, row in df.iterrows():
-        # Check entries_close_year column first (most reliable)
-        if ec_year_col:
-            ec_year = row.get(ec_year_col)
-            if pd.notna(ec_year):
-                try:
-                    year = int(ec_year)
-                    if year <= 2025:
-                        # Skip - entries close is in 2025 or earlier
-                        continue
-                    else:
-                        rows_to_keep.append(idx)
-                        continue
-                except (ValueError, TypeError):
-                    pass
-        
-        # Fallback: check all text in the row for years
-        all_text = ' '.join(str(v) for v in row.values if pd.notna(v))
-        all_years = re.findall(r'\b(20\d{2})\b', all_text)
-        
-        if all_years:
-            years = [int(y) for y in all_years]
-            # If any year is 2025 or earlier, skip
-            if min(years) <= 2025:
-                continue
-            else:
-                rows_to_keep.append(idx)
-        else:
-            # No year found anywhere - keep the row
-            rows_to_keep.append(idx)
+    keep = pd.Series(True, index=df.index)
+    needs_text_scan = pd.Series(True, index=df.index)
+    
+    # Check entries_close_year column first (most reliable): keep only years after 2025
+    if ec_year_col:
+        ec_years = pd.to_numeric(df[ec_year_col], errors='coerce')
+        has_year = ec_years.notna()
+        # int(year) > 2025 is the same as year >= 2026 for fractional values too
+        keep[has_year] = ec_years[has_year] >= 2026
+        needs_text_scan = ~has_year
+    
+    # Fallback: check all text in the row for years. If any year is 2025 or earlier, skip;
+    # no year found anywhere - keep the row
+    if needs_text_scan.any():
+        rows = df[needs_text_scan.to_numpy()]
+        all_text = pd.Series('', index=rows.index)
+        for col in rows.columns:
+            values = rows[col]
+            all_text = all_text + ' ' + values.astype(str).where(values.notna(), '')
+        keep[needs_text_scan] = ~all_text.str.contains(_RE_OLD_YEAR).to_numpy(dtype=bool)
     
     # Return filtered dataframe (drop the entries_close_year column from output)
-    result_df = df.loc[rows_to_keep].reset_index(drop=True)
+    result_df = df[keep.to_numpy()].reset_index(drop=True)
     if ec_year_col and ec_year_col in result_df.columns:
         result_df = result_df.drop(columns=[ec_year_col])
     
@@ -605,97 +745,172 @@ def apply_url_based_defaults(df, source_url=None):
     col_map = {col.lower().replace(' ', '_'): col for col in df.columns}
     
     category_col = col_map.get('category')
+    gender_col = col_map.get('gender')
     state_col = col_map.get('state')
     source_col = col_map.get('source_url')
     
-    # Determine the URL to use for inference
-    def get_url_for_row(row):
-        if source_col and pd.notna(row.get(source_col)):
-            return row[source_col]
-        return source_url
-    
-    # Get gender column
-    gender_col = col_map.get('gender')
+    # Determine the URL to use for inference: the row's own source URL, else the page URL
+    if source_col:
+        row_urls = df[source_col].where(df[source_col].notna(), source_url)
+    else:
+        row_urls = pd.Series([source_url] * len(df), index=df.index, dtype=object)
     
-    # Apply category defaults
+    # Apply category defaults (missing or generic 'All' values)
+    # Each block is skipped outright when no cell needs a default
     if category_col:
-        for idx, row in df.iterrows():
-            current_category = row.get(category_col)
-            if pd.isna(current_category) or str(current_category).strip() == '' or current_category == 'All':
-                url = get_url_for_row(row)
-                # Try to get category from URL
-                url_category = extract_category_from_url(url)
-                if url_category:
-                    df.at[idx, category_col] = url_category
-                elif pd.isna(current_category) or str(current_category).strip() == '':
-                    # Default to 'All' if no category can be determined
-                    df.at[idx, category_col] = "All"
+        blank = is_blank(df[category_col])
+        needs_default = blank | df[category_col].eq('All')
+        if needs_default.any():
+            url_category = row_urls.map(extract_category_from_url).where(needs_default)
+            # Default to 'All' if no category can be determined
+            df[category_col] = url_category.fillna(df[category_col].where(~blank, "All"))
     
     # Apply gender defaults
     if gender_col:
-        for idx, row in df.iterrows():
-            current_gender = row.get(gender_col)
-            if pd.isna(current_gender) or str(current_gender).strip() == '':
-                url = get_url_for_row(row)
-                # Try to get gender from URL
-                url_gender = extract_gender_from_url(url)
-                if url_gender:
-                    df.at[idx, gender_col] = url_gender
-                else:
-                    # Default to Men's if no gender can be determined
-                    df.at[idx, gender_col] = "Men's"
+        blank = is_blank(df[gender_col])
+        if blank.any():
+            url_gender = row_urls.map(extract_gender_from_url).where(blank)
+            # Default to Men's if no gender can be determined
+            df[gender_col] = url_gender.fillna(df[gender_col].where(~blank, "Men's"))
     
     # Apply state defaults
     if state_col:
-        for idx, row in df.iterrows():
-            current_state = row.get(state_col)
-            if pd.isna(current_state) or str(current_state).strip() == '':
-                url = get_url_for_row(row)
-                url_state = extract_state_from_url(url)
-                if url_state:
-                    df.at[idx, state_col] = url_state
+        blank = is_blank(df[state_col])
+        if blank.any():
+            url_state = row_urls.map(extract_state_from_url).where(blank)
+            df[state_col] = url_state.fillna(df[state_col])
     
     return df
 
 
-def get_csv_download_link(df, filename="cleaned_tournament_data.csv"):
-    """Generate a download link for CSV file."""
-    csv = df.to_csv(index=False)
-    b64 = base64.b64encode(csv.encode()).decode()
-    return f'<a href="data:file/csv;base64,{b64}" download="{filename}" class="download-btn">📥 Download CSV</a>'
+def get_csv_bytes(df):
+    """Serialize a DataFrame to UTF-8 CSV bytes for st.download_button."""
+    # Write encoded CSV straight into a byte buffer (no intermediate str copy)
+    output = io.BytesIO()
+    df.to_csv(output, index=False, encoding='utf-8')
+    return output.getvalue()
+
+
+_XLSX_MIME = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
 
 
-def get_excel_download_link(df, filename="cleaned_tournament_data.xlsx"):
-    """Generate a download link for Excel file."""
+@st.cache_data(show_spinner=False, max_entries=20)
+def get_excel_bytes(df):
+    """Serialize a DataFrame to .xlsx bytes for st.download_button.
+    
+    openpyxl is slow, and every rerun re-renders the download buttons, so the
+    workbook is cached on the DataFrame's contents.
+    """
     output = io.BytesIO()
     with pd.ExcelWriter(output, engine='openpyxl') as writer:
         df.to_excel(writer, index=False, sheet_name='Tournaments')
-    excel_data = output.getvalue()
-    b64 = base64.b64encode(excel_data).decode()
-    return f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{filename}" class="download-btn">📥 Download Excel</a>'
+    return output.getvalue()
+
+
+@st.cache_data(show_spinner=False, max_entries=20)
+def read_uploaded_csv(file_bytes):
+    """Parse an uploaded CSV into a DataFrame (cached on the file contents)."""
+    return pd.read_csv(io.BytesIO(file_bytes))
+
+
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=20)
+def clean_uploaded_csv(file_bytes):
+    """Clean an uploaded CSV (cached on the file contents).
+    
+    Expires after an hour like the other caches: clean_date rolls year-less dates
+    forward relative to today, so a cleaned table can go stale across days.
+    """
+    return clean_tournament_data(read_uploaded_csv(file_bytes))
 
 
 # --- URL Scraping with AI ---
 
+# Browser-like headers (without brotli encoding which requests doesn't handle well)
+_BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Accept-Encoding': 'gzip, deflate',  # Removed 'br' (brotli) as requests doesn't auto-decode it
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Sec-Fetch-User': '?1',
+    'Cache-Control': 'max-age=0',
+}
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_adapter():
+    """Return one shared HTTPAdapter so page fetches reuse pooled keep-alive connections.
+    
+    Only the connection pool is shared across users; each fetch builds its own
+    session with new_http_session, so cookies never carry over between users.
+    """
+    return HTTPAdapter(pool_connections=10, pool_maxsize=20)
+
+
+def new_http_session():
+    """Return a fresh requests session with browser headers, mounted on the shared adapter."""
+    session = requests.Session()
+    session.headers.update(_BROWSER_HEADERS)
+    adapter = get_http_adapter()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def is_cloudflare_challenge(html_content):
+    """Check whether a response is a Cloudflare bot-check page instead of real content."""
+    return 'Just a moment' in html_content or 'Checking your browser' in html_content
+
+
+@st.cache_data(ttl=600, show_spinner=False, max_entries=50)
+def _prefetch_page(url):
+    """Fetch one page for prefetch_pages, cached per URL for ten minutes.
+    
+    Failed, blocked or challenged pages raise instead of returning, so they are
+    never cached and get retried live by fetch_page_content.
+    """
+    response = new_http_session().get(url, timeout=30, allow_redirects=True)
+    response.raise_for_status()
+    if is_cloudflare_challenge(response.text):
+        raise requests.HTTPError(f"Cloudflare challenge page from {url}")
+    return response.text
+
+
+def prefetch_pages(urls, max_workers=8):
+    """Fetch all URLs in parallel and return {url: html} for the pages that loaded cleanly.
+    
+    At most max_workers pages download at once over the shared connection pool, so a
+    long URL list doesn't hammer one association's server. Failed, blocked or challenged
+    pages are left out so the caller can retry them one by one with fetch_page_content,
+    which reports errors to the user. Pages are cached one URL at a time (see
+    _prefetch_page), so editing the URL list only downloads the new URLs.
+    """
+    pages = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        futures = {url: executor.submit(_prefetch_page, url) for url in urls}
+        for url, future in futures.items():
+            try:
+                pages[url] = future.result()
+            except requests.RequestException:
+                continue
+    return pages
+
+
+# Statuses worth another attempt: 403 (bot blocks that often clear) plus rate limits and server errors
+_RETRY_STATUSES = (403, 429, 500, 502, 503, 504)
+
+
 def fetch_page_content(url, retry_count=2):
-    """Fetch HTML content from a URL with improved headers to avoid blocking."""
-    import time
-    import random
+    """Fetch HTML content from a URL with improved headers to avoid blocking.
     
-    # Browser-like headers (without brotli encoding which requests doesn't handle well)
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Accept-Encoding': 'gzip, deflate',  # Removed 'br' (brotli) as requests doesn't auto-decode it
-        'Connection': 'keep-alive',
-        'Upgrade-Insecure-Requests': '1',
-        'Sec-Fetch-Dest': 'document',
-        'Sec-Fetch-Mode': 'navigate',
-        'Sec-Fetch-Site': 'none',
-        'Sec-Fetch-User': '?1',
-        'Cache-Control': 'max-age=0',
-    }
+    This loop is the only retry layer: blocked, rate-limited, 5xx and connection
+    failures get at most retry_count more attempts.
+    """
+    import random
     
     for attempt in range(retry_count + 1):
         try:
@@ -703,13 +918,13 @@ def fetch_page_content(url, retry_count=2):
             if attempt > 0:
                 time.sleep(random.uniform(1, 3))
             
-            # Create a session for better cookie handling
-            session = requests.Session()
-            response = session.get(url, headers=headers, timeout=30, allow_redirects=True)
+            # Fresh session per fetch, so cookies only live for this page's redirects;
+            # the connection pool underneath is shared
+            response = new_http_session().get(url, timeout=30, allow_redirects=True)
             response.raise_for_status()
             
             # Check if we got a Cloudflare challenge page
-            if 'Just a moment' in response.text or 'Checking your browser' in response.text:
+            if is_cloudflare_challenge(response.text):
                 if attempt < retry_count:
                     st.warning(f"Cloudflare challenge detected (attempt {attempt + 1}/{retry_count + 1}). Retrying...")
                     time.sleep(2)
@@ -722,12 +937,21 @@ def fetch_page_content(url, retry_count=2):
             return response.text
             
         except requests.exceptions.HTTPError as e:
-            if response.status_code == 403 and attempt < retry_count:
-                st.warning(f"Access blocked (attempt {attempt + 1}/{retry_count + 1}). Retrying...")
+            if response.status_code in _RETRY_STATUSES and attempt < retry_count:
+                if response.status_code == 403:
+                    st.warning(f"Access blocked (attempt {attempt + 1}/{retry_count + 1}). Retrying...")
+                else:
+                    st.warning(f"Server returned {response.status_code} (attempt {attempt + 1}/{retry_count + 1}). Retrying...")
                 continue
             st.error(f"Error fetching URL: {str(e)}")
             st.info("💡 **Tip:** If this site blocks automated access, try using the '📋 Paste Content' tab instead.")
             return None
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt < retry_count:
+                st.warning(f"Connection failed (attempt {attempt + 1}/{retry_count + 1}). Retrying...")
+                continue
+            st.error(f"Error fetching URL: {str(e)}")
+            return None
         except requests.RequestException as e:
             st.error(f"Error fetching URL: {str(e)}")
             return None
@@ -735,96 +959,136 @@ def fetch_page_content(url, retry_count=2):
     return None
 
 
+# Lines that are pure site chrome (menus, auth links, legal footers) and carry no tournament data
+_RE_NAV_BOILERPLATE = re.compile(
+    r'^(?:home|menu|search|login|log in|sign in|sign up|logout|log out|my account|contact(?: us)?|'
+    r'about(?: us)?|skip to (?:main )?content|back to top|privacy policy|terms(?: of (?:use|service))?|'
+    r'follow us|share|print|close|(?:copyright|©).*)$',
+    re.I
+)
+
+
+def _class_selector(tags, keywords):
+    """Build a CSS selector for tags whose class contains any keyword (case-insensitive).
+    
+    Uses :is() so an element matching several keywords is only returned once.
+    """
+    keyword_part = ', '.join(f'[class*="{keyword}" i]' for keyword in keywords)
+    return f":is({', '.join(tags)}):is({keyword_part})"
+
+
+_CARD_SELECTOR = _class_selector(('div', 'article'), ('card', 'event-item', 'tournament-item', 'list-item', 'schedule-item'))
+_LIST_SELECTOR = _class_selector(('ul', 'ol'), ('tournament', 'event', 'schedule', 'list'))
+
+
+# Words that mark a generic row div as likely tournament data (substring match, any case)
+_RE_ROW_KEYWORDS = re.compile(
+    r'golf|club|course|championship|open|amateur|enter'
+    r'|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec',
+    re.I
+)
+
+
 def extract_text_from_html(html_content):
     """Extract readable text from HTML, focusing on structured tournament data."""
-    soup = BeautifulSoup(html_content, 'html.parser')
+    tree = HTMLParser(html_content)
     
     # Remove script and style elements
-    for element in soup(['script', 'style', 'nav', 'footer', 'header']):
-        element.decompose()
+    tree.strip_tags(['script', 'style', 'nav', 'footer', 'header'])
     
     extracted_data = []
+    seen_texts = set()
+    seen_nodes = set()  # rows/items already visited through an enclosing table or list
+    
+    def add_text(text):
+        """Append a line once, skipping duplicates and navigation boilerplate."""
+        if text in seen_texts or _RE_NAV_BOILERPLATE.match(text):
+            return
+        seen_texts.add(text)
+        extracted_data.append(text)
     
     # Get the page title for context
-    title = soup.title.string if soup.title else ""
+    title_node = tree.css_first('title')
+    title = title_node.text() if title_node else ""
     extracted_data.append(f"Page Title: {title}\n")
     
     # 1. Try to find tables first (most tournament data is in tables)
-    tables = soup.find_all('table')
+    tables = tree.css('table')
     if tables:
         extracted_data.append("\n=== TABLE DATA ===")
         for table in tables:
-            rows = table.find_all('tr')
+            rows = table.css('tr')
             for row in rows:
-                cells = row.find_all(['td', 'th'])
-                row_text = ' | '.join(cell.get_text(strip=True) for cell in cells)
+                if row.mem_id in seen_nodes:
+                    continue
+                seen_nodes.add(row.mem_id)
+                cells = row.css('td, th')
+                row_text = ' | '.join(cell.text(strip=True, skip_empty=True) for cell in cells)
                 if row_text.strip():
-                    extracted_data.append(row_text)
+                    add_text(row_text)
     
     # 2. Look for FSGA-style striped rows (div-based layouts)
-    striped_containers = soup.find_all('div', class_=lambda x: x and 'striped' in str(x).lower())
+    striped_containers = tree.css('div[class*="striped" i]')
     if striped_containers:
         extracted_data.append("\n=== STRIPED ROW DATA ===")
         for container in striped_containers:
-            rows = container.find_all('div', class_='row', recursive=False)
+            rows = [
+                child for child in container.iter()
+                if child.tag == 'div' and 'row' in (child.attributes.get('class') or '').split()
+            ]
             for row in rows:
                 # Get all column divs
-                cols = row.find_all('div', recursive=False)
+                cols = [child for child in row.iter() if child.tag == 'div']
                 row_parts = []
                 for col in cols:
-                    text = col.get_text(strip=True)
+                    text = col.text(strip=True, skip_empty=True)
                     if text:
                         row_parts.append(text)
                 if row_parts:
-                    extracted_data.append(' | '.join(row_parts))
+                    add_text(' | '.join(row_parts))
     
     # 3. Look for card-based layouts
-    cards = soup.find_all(['div', 'article'], class_=lambda x: x and any(
-        keyword in str(x).lower() for keyword in ['card', 'event-item', 'tournament-item', 'list-item', 'schedule-item']
-    ))
+    # Limit to avoid too much data; selectolax's css() has no match limit, so this slices the full list
+    cards = tree.css(_CARD_SELECTOR)[:100]
     if cards:
         extracted_data.append("\n=== CARD DATA ===")
-        for card in cards[:100]:  # Limit to avoid too much data
-            text = card.get_text(separator=' | ', strip=True)
+        for card in cards:
+            text = card.text(separator=' | ', strip=True, skip_empty=True)
             if len(text) > 15 and len(text) < 1000:
-                extracted_data.append(text)
+                add_text(text)
     
     # 4. Look for list-based layouts
-    list_containers = soup.find_all(['ul', 'ol'], class_=lambda x: x and any(
-        keyword in str(x).lower() for keyword in ['tournament', 'event', 'schedule', 'list']
-    ))
+    list_containers = tree.css(_LIST_SELECTOR)
     if list_containers:
         extracted_data.append("\n=== LIST DATA ===")
         for container in list_containers:
-            items = container.find_all('li')
+            items = container.css('li')
             for item in items:
-                text = item.get_text(strip=True)
+                if item.mem_id in seen_nodes:
+                    continue
+                seen_nodes.add(item.mem_id)
+                text = item.text(strip=True, skip_empty=True)
                 if len(text) > 15:
-                    extracted_data.append(text)
+                    add_text(text)
     
     # 5. Look for generic row-based layouts (Bootstrap-style)
+    # nav/header/footer were stripped above, so no navigation rows remain here
     if len(extracted_data) < 5:  # If we haven't found much structured data
-        row_divs = soup.find_all('div', class_=lambda x: x and 'row' in str(x).lower())
-        seen_texts = set()
+        row_divs = tree.css('div[class*="row" i]')
         extracted_data.append("\n=== ROW DATA ===")
         for row in row_divs:
-            # Skip if this is a navigation or header row
-            if row.find_parent(['nav', 'header', 'footer']):
-                continue
-            text = row.get_text(separator=' | ', strip=True)
+            text = row.text(separator=' | ', strip=True, skip_empty=True)
             # Only include rows that look like tournament data (have dates or golf keywords)
             if len(text) > 30 and len(text) < 500:
-                if any(keyword in text.lower() for keyword in ['golf', 'club', 'course', 'championship', 'open', 'amateur', 'enter', 'jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec']):
-                    if text not in seen_texts:
-                        seen_texts.add(text)
-                        extracted_data.append(text)
+                if _RE_ROW_KEYWORDS.search(text):
+                    add_text(text)
     
     # 6. If still no data, get main content
     if len(extracted_data) < 5:
-        main_content = soup.find('main') or soup.find('body')
+        main_content = tree.css_first('main') or tree.body
         if main_content:
             extracted_data.append("\n=== MAIN CONTENT ===")
-            extracted_data.append(main_content.get_text(separator='\n', strip=True))
+            extracted_data.append(main_content.text(separator='\n', strip=True, skip_empty=True))
     
     combined_text = '\n'.join(extracted_data)
     
@@ -832,14 +1096,37 @@ def extract_text_from_html(html_content):
     return combined_text[:30000]
 
 
-def parse_tournaments_with_ai(text_content, api_key, chunk_size=12000):
-    """Use OpenAI to parse tournament data from text. Handles large content by chunking."""
+@st.cache_resource(show_spinner=False)
+def get_openai_client(api_key):
+    """Return a shared OpenAI client per API key so its connection pool is reused across calls."""
+    return OpenAI(api_key=api_key)
+
+
+class AIResponseError(Exception):
+    """The AI response for a chunk could not be parsed as a complete tournament list.
     
-    client = OpenAI(api_key=api_key)
+    tournaments holds whatever complete objects were recovered from a truncated
+    response (possibly none); raw_response is kept for the debugging expander.
+    """
+    
+    def __init__(self, message, tournaments, raw_response):
+        super().__init__(message)
+        self.tournaments = tournaments
+        self.raw_response = raw_response
+
+
+def parse_tournaments_with_ai(text_content, api_key, chunk_size=12000, max_workers=4):
+    """Use OpenAI to parse tournament data from text. Handles large content by chunking.
+    
+    Chunks are sent to the API concurrently (up to max_workers at a time) over the
+    shared client's connection pool; results keep the original chunk order.
+    Returns (tournaments, complete); complete is False when any chunk failed or was
+    truncated. Each chunk's result is cached for an hour by _parse_chunk_cached, which
+    only ever stores complete results, so a retry re-sends just the chunks that failed.
+    """
     
     # If content is very large, process in chunks
     if len(text_content) > chunk_size:
-        all_tournaments = []
         chunks = []
         
         # Split by lines to avoid cutting mid-tournament
@@ -858,140 +1145,194 @@ def parse_tournaments_with_ai(text_content, api_key, chunk_size=12000):
             chunks.append(current_chunk)
         
         st.info(f"Processing {len(chunks)} chunks of content...")
-        
-        for i, chunk in enumerate(chunks):
-            st.text(f"Processing chunk {i+1}/{len(chunks)}...")
-            chunk_tournaments = _parse_single_chunk(client, chunk)
-            if chunk_tournaments:
-                all_tournaments.extend(chunk_tournaments)
-        
-        return all_tournaments
     else:
-        return _parse_single_chunk(client, text_content)
+        chunks = [text_content]
+    
+    # Workers only record their running tournament count; every st.* call happens
+    # here on the script thread (polling at most ~10 times a second for the caption)
+    found = [0] * len(chunks)
+    progress = st.empty()
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        futures = [
+            executor.submit(_parse_chunk_cached, chunk, api_key, functools.partial(found.__setitem__, i))
+            for i, chunk in enumerate(chunks)
+        ]
+        pending = futures
+        shown = 0
+        while pending:
+            _, pending = wait(pending, timeout=0.1)
+            if sum(found) != shown:
+                shown = sum(found)
+                progress.caption(f"Receiving AI response... {shown} tournaments so far")
+    progress.empty()
+    
+    all_tournaments = []
+    complete = True
+    for future in futures:
+        try:
+            all_tournaments.extend(future.result())
+        except AIResponseError as e:
+            complete = False
+            st.warning("Response was truncated. Attempting to recover partial data...")
+            if e.tournaments:
+                all_tournaments.extend(e.tournaments)
+                st.info(f"Recovered {len(e.tournaments)} tournaments from truncated response")
+            else:
+                st.error(f"Error parsing AI response: {str(e)}")
+                with st.expander("Show raw response (for debugging)"):
+                    result = e.raw_response
+                    st.code(result[:2000] + "..." if len(result) > 2000 else result)
+        except Exception as e:
+            complete = False
+            st.error(f"Error calling OpenAI API: {str(e)}")
+    
+    return all_tournaments, complete
 
 
-def _parse_single_chunk(client, text_content):
-    """Parse a single chunk of text content with AI."""
-    
-    prompt = """You are a data extraction expert. Extract ALL golf tournament information from the following webpage content.
+@st.cache_data(ttl=3600, show_spinner=False, max_entries=200)
+def _parse_chunk_cached(text_content, api_key, _on_progress=None):
+    """Cached _parse_single_chunk for one chunk of page text.
+    
+    Failed or truncated parses raise, and st.cache_data never stores a call that
+    raises, so only complete results are reused. Makes no st.* calls, so there is
+    no UI to replay on a cache hit.
+    """
+    return _parse_single_chunk(get_openai_client(api_key), text_content, _on_progress)
 
-IMPORTANT: Extract EVERY tournament entry you find. Do not skip any. Each row/entry typically contains:
-- A date (like "Jan 13", "Feb 7-8", "Mar 2", etc.)
-- An "Entries Close" date with a year (like "Entries Close: August 13, 2025")
-- A tournament/event name (may include "*FULL*" marker)
-- A golf course or venue name
-- Location info (city, state like "FL" or "Florida")
 
-For each tournament found, extract:
-- date: The tournament date exactly as shown (e.g., "Jan 13", "Feb 7-8")
-- entries_close_year: The YEAR from the "Entries Close" date if present (e.g., 2025, 2026). This is CRITICAL for filtering. Look for patterns like "Entries Close: August 13, 2025" and extract just the year (2025).
-- name: The tournament/event name (remove *FULL* markers)
-- course: The golf course or venue name (e.g., "Southern Hills Plantation Club", "Black Diamond Ranch")
-- category: The category if mentioned (Senior, Men's, Women's, Junior, Four-Ball, etc.) - look for keywords in the name
-- city: The city (e.g., "Brooksville", "Fort Myers")
-- state: The state abbreviation (e.g., "FL")
-- zip: The ZIP code if available (usually null)
+# Structured-output schema for the AI parser: every field is required but nullable
+_TOURNAMENT_FIELDS = {
+    'date': {'type': ['string', 'null']},
+    'entries_close_year': {'type': ['integer', 'null']},
+    'name': {'type': ['string', 'null']},
+    'course': {'type': ['string', 'null']},
+    'category': {'type': ['string', 'null']},
+    'city': {'type': ['string', 'null']},
+    'state': {'type': ['string', 'null']},
+    'zip': {'type': ['string', 'null']},
+}
 
-Return the data as a JSON array of objects. If a field is not found, use null.
-Extract ALL tournaments - there may be 10, 20, or more entries.
-Skip navigation items, headers, footers, and non-tournament content.
+_TOURNAMENT_SCHEMA = {
+    'name': 'tournament_list',
+    'strict': True,
+    'schema': {
+        'type': 'object',
+        'properties': {
+            'tournaments': {
+                'type': 'array',
+                'items': {
+                    'type': 'object',
+                    'properties': _TOURNAMENT_FIELDS,
+                    'required': list(_TOURNAMENT_FIELDS),
+                    'additionalProperties': False,
+                },
+            },
+        },
+        'required': ['tournaments'],
+        'additionalProperties': False,
+    },
+}
 
-Example output format:
-[
-  {"date": "Jan 13", "entries_close_year": 2026, "name": "Senior Championship", "course": "Southern Hills Plantation Club", "category": "Senior", "city": "Brooksville", "state": "FL", "zip": null},
-  {"date": "May 2-6", "entries_close_year": 2025, "name": "U.S. Women's Amateur Four-Ball", "course": "Desert Mountain Club", "category": "Women's", "city": "Scottsdale", "state": "AZ", "zip": null}
-]
+
+def _parse_single_chunk(client, text_content, on_progress=None):
+    """Parse a single chunk of text content with AI.
+    
+    Runs on a worker thread, so it makes no st.* calls: the running tournament
+    count goes to on_progress, API errors propagate, and a response that can't
+    be fully parsed raises AIResponseError with whatever could be recovered.
+    """
+    
+    prompt = """Extract EVERY golf tournament entry from the webpage content below. Do not skip any.
+
+Fields (use null when missing):
+- date: tournament date exactly as shown (e.g. "Jan 13", "Feb 7-8")
+- entries_close_year: the YEAR of the "Entries Close" date (e.g. "Entries Close: August 13, 2025" -> 2025). CRITICAL for filtering.
+- name: tournament/event name without *FULL* markers
+- course: golf course or venue name
+- category: Senior, Men's, Women's, Junior, Four-Ball, etc. if mentioned
+- city, state (abbreviation, e.g. "FL"), zip
+
+Skip navigation, headers, footers and other non-tournament content.
 
 Webpage content:
 """
     
+    stream = client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": "You are a precise data extraction assistant."},
+            {"role": "user", "content": prompt + text_content}
+        ],
+        response_format={"type": "json_schema", "json_schema": _TOURNAMENT_SCHEMA},
+        temperature=0.1,
+        max_tokens=16000,  # Increased to handle more tournaments
+        stream=True
+    )
+    
+    # Collect the streamed response, reporting progress as tournament objects close
+    parts = []
+    found = 0
+    for event in stream:
+        if not event.choices:
+            continue
+        delta = event.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            closed = delta.count('}')
+            if closed:
+                found += closed
+                if on_progress:
+                    on_progress(found)
+    
+    result = ''.join(parts).strip()
+    
+    # Try to parse JSON
     try:
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "system", "content": "You are a precise data extraction assistant. Extract ALL tournament entries - do not skip any. Always respond with valid JSON only, no markdown formatting or explanation."},
-                {"role": "user", "content": prompt + text_content}
-            ],
-            temperature=0.1,
-            max_tokens=16000  # Increased to handle more tournaments
-        )
+        return json.loads(result)['tournaments']
+    except json.JSONDecodeError as e:
+        # Structured output can still be cut off by max_tokens - recover the complete objects
+        tournaments = []
         
-        result = response.choices[0].message.content.strip()
-        
-        # Clean up the response - remove markdown code blocks if present
-        if result.startswith('```'):
-            result = re.sub(r'^```(?:json)?\n?', '', result)
-            result = re.sub(r'\n?```$', '', result)
-        
-        # Try to parse JSON
-        try:
-            tournaments = json.loads(result)
-            return tournaments
-        except json.JSONDecodeError as e:
-            # Try to fix truncated JSON by finding the last complete object
-            st.warning("Response was truncated. Attempting to recover partial data...")
-            
-            # Try to find the last complete JSON object
-            # Look for the last "}," or "}" that completes an object
-            last_complete = result.rfind('},')
-            if last_complete > 0:
-                # Try to close the array after the last complete object
-                fixed_result = result[:last_complete + 1] + ']'
-                try:
-                    tournaments = json.loads(fixed_result)
-                    st.info(f"Recovered {len(tournaments)} tournaments from truncated response")
-                    return tournaments
-                except json.JSONDecodeError:
-                    pass
-            
-            # Try another approach - find last complete object ending with }
-            last_brace = result.rfind('}')
-            if last_brace > 0:
-                # Count brackets to find valid JSON
-                test_result = result[:last_brace + 1]
-                # Make sure it ends properly
-                if not test_result.rstrip().endswith(']'):
-                    test_result = test_result + ']'
-                try:
-                    tournaments = json.loads(test_result)
-                    st.info(f"Recovered {len(tournaments)} tournaments from truncated response")
-                    return tournaments
-                except json.JSONDecodeError:
-                    pass
-            
-            # If all recovery attempts fail, show error
-            st.error(f"Error parsing AI response: {str(e)}")
-            with st.expander("Show raw response (for debugging)"):
-                st.code(result[:2000] + "..." if len(result) > 2000 else result)
-            return []
+        # Close the tournaments array after the last complete object
+        last_complete = result.rfind('}')
+        if last_complete > 0:
+            fixed_result = result[:last_complete + 1] + ']}'
+            try:
+                tournaments = json.loads(fixed_result)['tournaments']
+            except json.JSONDecodeError:
+                pass
         
-    except Exception as e:
-        st.error(f"Error calling OpenAI API: {str(e)}")
-        return []
+        raise AIResponseError(str(e), tournaments, result)
 
 
-def process_url_with_ai(url, api_key):
-    """Full pipeline: fetch URL, extract text, parse with AI, clean data."""
+def process_url_with_ai(url, api_key, html_content=None):
+    """Full pipeline: fetch URL, extract text, parse with AI, clean data.
+    
+    Pass html_content when the page was already fetched (e.g. by prefetch_pages).
+    Returns (cleaned_df, complete): cleaned_df is None when nothing was extracted,
+    and complete is False when part of the page's AI parse failed or was truncated.
+    """
     
     # Step 1: Fetch the page
-    with st.spinner("Fetching webpage..."):
-        html_content = fetch_page_content(url)
-        if not html_content:
-            return None
+    if html_content is None:
+        with st.spinner("Fetching webpage..."):
+            html_content = fetch_page_content(url)
+            if not html_content:
+                return None, False
     
     # Step 2: Extract text
     with st.spinner("Extracting content..."):
         text_content = extract_text_from_html(html_content)
         if not text_content or len(text_content) < 100:
             st.warning("Could not extract meaningful content from the page. The page might require JavaScript to load.")
-            return None
+            return None, False
     
     # Step 3: Parse with AI
     with st.spinner("AI is analyzing the content..."):
-        tournaments = parse_tournaments_with_ai(text_content, api_key)
+        tournaments, complete = parse_tournaments_with_ai(text_content, api_key)
         if not tournaments:
             st.warning("No tournaments found on this page.")
-            return None
+            return None, complete
     
     # Step 4: Convert to DataFrame and clean
     df = pd.DataFrame(tournaments)
@@ -1004,10 +1345,453 @@ def process_url_with_ai(url, api_key):
     # Pass the raw text content so we can check "Entries Close" dates
     cleaned_df = filter_old_dates(cleaned_df, raw_text_content=text_content)
     
-    return cleaned_df
+    return cleaned_df, complete
 
 
 # --- Streamlit UI ---
+def rerun_with_notices(key, notices):
+    """Rerun the whole app after combined results change, keeping the tab's messages.
+    
+    The tabs are fragments, so without a full rerun the sidebar's count and
+    downloads would stay stale. notices is a list of (kind, message) pairs, e.g.
+    ('success', '...'), shown again by show_notices(key) on the next run.
+    """
+    st.session_state[key] = notices
+    st.rerun(scope="app")
+
+
+def show_notices(key):
+    """Show (once) the messages saved by rerun_with_notices under key."""
+    for kind, message in st.session_state.pop(key, []):
+        getattr(st, kind)(message)
+
+
+@st.fragment
+def render_url_tab(api_key):
+    """Tab 1: fetch URLs and extract tournaments with AI (reruns on its own as a fragment)."""
+    st.markdown("### Enter tournament schedule URLs")
+    st.markdown("*Enter one URL per line to extract data from multiple sources*")
+    
+    st.warning("⚠️ **Note:** Some websites (like FSGA) may block cloud servers. If URLs fail here, use the **'📋 Paste Content'** tab instead - it works with any site!")
+    
+    urls_input = st.text_area(
+        "URLs",
+        placeholder="https://www.fsga.org/TournamentCategory/EnterList/...\nhttps://wpga-onlineregistration.golfgenius.com/pages/...\nhttps://usamtour.bluegolf.com/bluegolf/...",
+        height=120,
+        label_visibility="collapsed"
+    )
+    
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        parse_button = st.button("🔍 Extract Data", type="primary", use_container_width=True)
+    with col2:
+        if 'url_results' in st.session_state and st.session_state['url_results'] is not None:
+            clear_button = st.button("🗑️ Clear Results", use_container_width=False)
+            if clear_button:
+                # Drop these pages from the prefetch cache too, so the next extract downloads them fresh
+                for processed in st.session_state.get('processed_urls', []):
+                    _prefetch_page.clear(processed['url'])
+                st.session_state['url_results'] = None
+                st.session_state['processed_urls'] = []
+                st.rerun()
+    
+    if parse_button:
+        if not urls_input.strip():
+            st.error("Please enter at least one URL")
+        elif not api_key:
+            st.error("Please enter your OpenAI API key in the sidebar")
+        else:
+            # Parse multiple URLs
+            urls = [url.strip() for url in urls_input.strip().split('\n') if url.strip()]
+            
+            if len(urls) == 0:
+                st.error("Please enter at least one valid URL")
+            else:
+                all_results = []
+                processed_urls = []
+                all_clean = True  # every URL extracted fully, with no errors or warnings to keep on screen
+                
+                # Fetch all pages concurrently; any that fail are retried individually below
+                with st.spinner(f"Fetching {len(urls)} webpage(s)..."):
+                    prefetched_pages = prefetch_pages(urls)
+                
+                # Progress tracking
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                status_text.text(f"Processing {len(urls)} URL(s)...")
+                
+                # URLs are processed one at a time on the script thread: large pages already
+                # send their chunks to the API concurrently, and a second pool on top would
+                # multiply in-flight requests past low-tier rate limits
+                for i, url in enumerate(urls):
+                    status_text.text(f"Processing URL {i+1} of {len(urls)}: {url[:50]}...")
+                    progress_bar.progress((i) / len(urls))
+                    
+                    try:
+                        result_df, complete = process_url_with_ai(url, api_key, prefetched_pages.get(url))
+                        
+                        if result_df is not None and len(result_df) > 0:
+                            # Add source URL column
+                            result_df['Source URL'] = url
+                            all_results.append(result_df)
+                            processed_urls.append({'url': url, 'count': len(result_df), 'status': '✅'})
+                            st.success(f"✅ Found {len(result_df)} tournaments from {url[:50]}...")
+                            if not complete:
+                                all_clean = False
+                                st.warning(f"⚠️ Part of {url[:50]}... could not be parsed. Extract again to retry it.")
+                        else:
+                            all_clean = False
+                            processed_urls.append({'url': url, 'count': 0, 'status': '⚠️'})
+                            st.warning(f"⚠️ No tournaments found from {url[:50]}...")
+                    except Exception as e:
+                        all_clean = False
+                        processed_urls.append({'url': url, 'count': 0, 'status': '❌'})
+                        st.error(f"❌ Error processing {url[:50]}...: {str(e)}")
+                
+                progress_bar.progress(1.0)
+                status_text.text("Processing complete!")
+                
+                # Combine all results
+                if all_results:
+                    combined_df = pd.concat(all_results, ignore_index=True)
+                    st.session_state['url_results'] = combined_df
+                    st.session_state['processed_urls'] = processed_urls
+                    
+                    # Add to combined results in sidebar
+                    if 'combined_results' not in st.session_state:
+                        st.session_state['combined_results'] = pd.DataFrame()
+                    st.session_state['combined_results'] = pd.concat(
+                        [st.session_state['combined_results'], combined_df], 
+                        ignore_index=True
+                    ).drop_duplicates(subset=['Date', 'Name', 'Course'], keep='first')
+                    
+                    total_tournaments = len(combined_df)
+                    total_message = f"🎉 Total: {total_tournaments} tournaments extracted from {len([p for p in processed_urls if p['status'] == '✅'])} URL(s)!"
+                    if all_clean:
+                        rerun_with_notices('url_notices', [
+                            ('success', total_message),
+                            ('info', f"📦 Added to combined results ({len(st.session_state['combined_results'])} total in sidebar)"),
+                        ])
+                    else:
+                        # A full rerun would wipe the per-URL errors and warnings above, so the
+                        # sidebar is left to catch up on the next interaction instead
+                        st.success(total_message)
+                        st.info(f"📦 Added to combined results ({len(st.session_state['combined_results'])} total). Click 🔄 in the sidebar to refresh its count.")
+                else:
+                    st.error("No tournaments were extracted from any of the URLs.")
+    
+    # Display results
+    if 'url_results' in st.session_state and st.session_state['url_results'] is not None:
+        df = st.session_state['url_results']
+        show_notices('url_notices')
+        
+        # Show processing summary if multiple URLs were processed
+        if 'processed_urls' in st.session_state and len(st.session_state['processed_urls']) > 1:
+            with st.expander("📋 Processing Summary", expanded=False):
+                summary_df = pd.DataFrame(st.session_state['processed_urls'])
+                summary_df.columns = ['URL', 'Tournaments Found', 'Status']
+                st.dataframe(summary_df, use_container_width=True)
+        
+        st.markdown("### 📊 Extracted Tournament Data")
+        st.dataframe(df, use_container_width=True, height=400)
+        
+        # Stats
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Tournaments", len(df))
+        with col2:
+            valid_dates = df['Date'].notna().sum()
+            st.metric("Valid Dates", f"{valid_dates}/{len(df)}")
+        with col3:
+            valid_courses = df['Course'].notna().sum()
+            st.metric("Valid Courses", f"{valid_courses}/{len(df)}")
+        with col4:
+            if 'Source URL' in df.columns:
+                unique_sources = df['Source URL'].nunique()
+                st.metric("Sources", unique_sources)
+            else:
+                categories = df['Category'].notna().sum()
+                st.metric("Categories Found", f"{categories}/{len(df)}")
+        
+        # Download buttons
+        st.markdown("### 📥 Download")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "📥 Download CSV",
+                data=get_csv_bytes(df),
+                file_name="tournament_data.csv",
+                mime="text/csv",
+                key="download_csv_url"
+            )
+        with col2:
+            st.download_button(
+                "📥 Download Excel",
+                data=get_excel_bytes(df),
+                file_name="tournament_data.xlsx",
+                mime=_XLSX_MIME,
+                key="download_excel_url"
+            )
+
+
+@st.fragment
+def render_csv_tab():
+    """Tab 2: upload and clean a CSV file (reruns on its own as a fragment)."""
+    st.markdown("### Upload a CSV file with tournament data")
+    
+    uploaded_file = st.file_uploader(
+        "Choose a CSV file",
+        type=['csv'],
+        help="Upload a CSV file containing tournament data"
+    )
+    
+    if uploaded_file is not None:
+        try:
+            # Read the CSV file (cached on its contents, so other widgets' reruns skip this)
+            file_bytes = uploaded_file.getvalue()
+            df = read_uploaded_csv(file_bytes)
+            
+            # Display original data
+            st.markdown("### 📄 Original Data")
+            st.dataframe(df, use_container_width=True, height=250)
+            
+            # Clean the data
+            with st.spinner("Cleaning data..."):
+                cleaned_df = clean_uploaded_csv(file_bytes)
+            
+            # Display cleaned data
+            st.markdown("### ✨ Cleaned Data")
+            st.dataframe(cleaned_df, use_container_width=True, height=350)
+            
+            # Stats
+            st.markdown("### 📊 Cleaning Summary")
+            col1, col2, col3, col4 = st.columns(4)
+            
+            with col1:
+                valid_dates = cleaned_df['Date'].notna().sum()
+                st.metric("Valid Dates", f"{valid_dates}/{len(cleaned_df)}")
+            
+            with col2:
+                valid_names = cleaned_df['Name'].notna().sum()
+                st.metric("Valid Names", f"{valid_names}/{len(cleaned_df)}")
+            
+            with col3:
+                valid_states = cleaned_df['State'].notna().sum()
+                st.metric("Valid States", f"{valid_states}/{len(cleaned_df)}")
+            
+            with col4:
+                valid_categories = cleaned_df['Category'].notna().sum()
+                st.metric("Categories", f"{valid_categories}/{len(cleaned_df)}")
+            
+            # Add to combined results button
+            st.markdown("### 📦 Add to Combined Results")
+            if st.button("➕ Add to Combined Results", key="add_csv_to_combined", use_container_width=True):
+                cleaned_df_with_source = cleaned_df.copy()
+                cleaned_df_with_source['Source'] = uploaded_file.name
+                
+                if 'combined_results' not in st.session_state:
+                    st.session_state['combined_results'] = pd.DataFrame()
+                st.session_state['combined_results'] = pd.concat(
+                    [st.session_state['combined_results'], cleaned_df_with_source], 
+                    ignore_index=True
+                ).drop_duplicates(subset=['Date', 'Name', 'Course'], keep='first')
+                rerun_with_notices('csv_notices', [
+                    ('success', f"✅ Added {len(cleaned_df)} tournaments to combined results ({len(st.session_state['combined_results'])} total)"),
+                ])
+            show_notices('csv_notices')
+            
+            # Download options
+            st.markdown("### 📥 Download This File Only")
+            col1, col2 = st.columns(2)
+            with col1:
+                st.download_button(
+                    "📥 Download CSV",
+                    data=get_csv_bytes(cleaned_df),
+                    file_name="cleaned_tournament_data.csv",
+                    mime="text/csv",
+                    key="download_csv_upload"
+                )
+            with col2:
+                st.download_button(
+                    "📥 Download Excel",
+                    data=get_excel_bytes(cleaned_df),
+                    file_name="cleaned_tournament_data.xlsx",
+                    mime=_XLSX_MIME,
+                    key="download_excel_upload"
+                )
+                
+        except Exception as e:
+            st.error(f"Error processing file: {str(e)}")
+    
+    else:
+        st.info("👆 Upload a CSV file to get started")
+        
+        with st.expander("📋 See example CSV format"):
+            sample_data = pd.DataFrame({
+                'Date': ['5/15/2025', 'June 3, 2025', '2025-07-20'],
+                'Name': ['Senior Championship *FULL*', 'Junior Open', "Women's Amateur Classic"],
+                'Course': ['Pine Valley GC', 'Augusta National Golf Club', 'Pebble Beach'],
+                'Category': ['', '', ''],
+                'City': ['Clementon', 'Augusta', 'Pebble Beach'],
+                'State': ['New Jersey', 'GA', 'California'],
+                'Zip': ['08021', '30904', '93953']
+            })
+            st.dataframe(sample_data, use_container_width=True)
+
+
+@st.fragment
+def render_paste_tab(api_key):
+    """Tab 3: extract tournaments from pasted page content (reruns on its own as a fragment)."""
+    st.markdown("### Paste content from a protected page")
+    st.markdown("*For pages that require login (like Golf Genius), simply copy the visible text or HTML and paste it here.*")
+    
+    st.info("""
+    **How to copy content:**
+    - **Easy way:** Select all visible text on the page (Cmd+A / Ctrl+A) and copy (Cmd+C / Ctrl+C)
+    - **Alternative:** Right-click → View Page Source, then copy all HTML
+    
+    Both formats work! The AI will extract tournament data from whatever you paste.
+    """)
+    
+    # Optional: source URL for state/category inference
+    source_url_input = st.text_input(
+        "Source URL (optional)",
+        placeholder="https://www.golfgenius.com/leagues/36562/...",
+        help="Enter the original URL to help infer state and category"
+    )
+    
+    html_input = st.text_area(
+        "Paste content here",
+        placeholder="Paste tournament listings here...\n\nExample:\n44th Alabama State Four-Ball Championship\nWed, Apr 29, 2026 - Sat, May 2, 2026\nCourse: Canebrake Club\n...",
+        height=250,
+        label_visibility="collapsed"
+    )
+    
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        parse_html_button = st.button("🔍 Extract Data", type="primary", use_container_width=True, key="parse_html")
+    with col2:
+        if 'html_results' in st.session_state and st.session_state['html_results'] is not None:
+            clear_html_button = st.button("🗑️ Clear Results", use_container_width=False, key="clear_html")
+            if clear_html_button:
+                st.session_state['html_results'] = None
+                st.rerun()
+    
+    if parse_html_button:
+        if not html_input.strip():
+            st.error("Please paste content")
+        elif not api_key:
+            st.error("Please enter your OpenAI API key in the sidebar")
+        elif len(html_input) < 100:
+            st.error("Content seems too short. Make sure you copied enough text.")
+        else:
+            try:
+                # Determine if it's HTML or plain text
+                is_html = html_input.strip().startswith('<') or '<html' in html_input.lower() or '<div' in html_input.lower()
+                
+                if is_html:
+                    # Extract text from HTML
+                    with st.spinner("Extracting content from HTML..."):
+                        text_content = extract_text_from_html(html_input)
+                else:
+                    # Use the text directly
+                    text_content = html_input.strip()
+                
+                if not text_content or len(text_content) < 50:
+                    st.warning("Could not extract meaningful content.")
+                else:
+                    st.success(f"Processing {len(text_content)} characters of content...")
+                    
+                    # Parse with AI
+                    with st.spinner("AI is analyzing the content..."):
+                        tournaments, complete = parse_tournaments_with_ai(text_content, api_key)
+                        
+                        if not tournaments:
+                            st.warning("No tournaments found in the content.")
+                        else:
+                            # Convert to DataFrame and clean
+                            df = pd.DataFrame(tournaments)
+                            cleaned_df = clean_tournament_data(df)
+                            
+                            # Apply URL-based defaults if source URL provided
+                            if source_url_input.strip():
+                                cleaned_df = apply_url_based_defaults(cleaned_df, source_url=source_url_input.strip())
+                            else:
+                                cleaned_df = apply_url_based_defaults(cleaned_df)
+                            
+                            # Filter old dates
+                            cleaned_df = filter_old_dates(cleaned_df, raw_text_content=text_content)
+                            
+                            # Add source info
+                            if source_url_input.strip():
+                                cleaned_df['Source URL'] = source_url_input.strip()
+                            else:
+                                cleaned_df['Source'] = 'Pasted Content'
+                            
+                            st.session_state['html_results'] = cleaned_df
+                            
+                            # Add to combined results
+                            if 'combined_results' not in st.session_state:
+                                st.session_state['combined_results'] = pd.DataFrame()
+                            st.session_state['combined_results'] = pd.concat(
+                                [st.session_state['combined_results'], cleaned_df], 
+                                ignore_index=True
+                            ).drop_duplicates(subset=['Date', 'Name', 'Course'], keep='first')
+                            
+                            notices = [
+                                ('success', f"🎉 Found {len(cleaned_df)} tournaments!"),
+                                ('info', f"📦 Added to combined results ({len(st.session_state['combined_results'])} total in sidebar)"),
+                            ]
+                            if not complete:
+                                notices.append(('warning', "Part of the content could not be parsed. Extract again to retry it."))
+                            rerun_with_notices('html_notices', notices)
+                        
+            except Exception as e:
+                st.error(f"Error processing content: {str(e)}")
+    
+    # Display results
+    if 'html_results' in st.session_state and st.session_state['html_results'] is not None:
+        df = st.session_state['html_results']
+        show_notices('html_notices')
+        
+        st.markdown("### 📊 Extracted Tournament Data")
+        st.dataframe(df, use_container_width=True, height=400)
+        
+        # Stats
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Tournaments", len(df))
+        with col2:
+            valid_dates = df['Date'].notna().sum()
+            st.metric("Valid Dates", f"{valid_dates}/{len(df)}")
+        with col3:
+            valid_courses = df['Course'].notna().sum()
+            st.metric("Valid Courses", f"{valid_courses}/{len(df)}")
+        with col4:
+            valid_states = df['State'].notna().sum()
+            st.metric("Valid States", f"{valid_states}/{len(df)}")
+        
+        # Download buttons
+        st.markdown("### 📥 Download")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button(
+                "📥 Download CSV",
+                data=get_csv_bytes(df),
+                file_name="tournament_data_from_html.csv",
+                mime="text/csv",
+                key="download_csv_html"
+            )
+        with col2:
+            st.download_button(
+                "📥 Download Excel",
+                data=get_excel_bytes(df),
+                file_name="tournament_data_from_html.xlsx",
+                mime=_XLSX_MIME,
+                key="download_excel_html"
+            )
+
+
 def main():
     # Custom CSS
     st.markdown("""
@@ -1023,19 +1807,6 @@ def main():
             color: #666;
             margin-bottom: 2rem;
         }
-        .download-btn {
-            display: inline-block;
-            padding: 0.5rem 1rem;
-            background-color: #1e5631;
-            color: white !important;
-            text-decoration: none;
-            border-radius: 5px;
-            margin: 0.25rem;
-            font-weight: 500;
-        }
-        .download-btn:hover {
-            background-color: #2d7a47;
-        }
         .stats-box {
             background-color: #f0f7f0;
             padding: 1rem;
@@ -1116,8 +1887,20 @@ def main():
                 st.caption(f"From {sources} source(s)")
             
             # Download buttons
-            st.markdown(get_csv_download_link(combined_df, "all_tournaments.csv"), unsafe_allow_html=True)
-            st.markdown(get_excel_download_link(combined_df, "all_tournaments.xlsx"), unsafe_allow_html=True)
+            st.download_button(
+                "📥 Download CSV",
+                data=get_csv_bytes(combined_df),
+                file_name="all_tournaments.csv",
+                mime="text/csv",
+                key="download_csv_combined"
+            )
+            st.download_button(
+                "📥 Download Excel",
+                data=get_excel_bytes(combined_df),
+                file_name="all_tournaments.xlsx",
+                mime=_XLSX_MIME,
+                key="download_excel_combined"
+            )
             
             # Clear button
             if st.button("🗑️ Clear All", use_container_width=True):
@@ -1135,350 +1918,15 @@ def main():
     
     # --- TAB 1: URL Parsing ---
     with tab1:
-        st.markdown("### Enter tournament schedule URLs")
-        st.markdown("*Enter one URL per line to extract data from multiple sources*")
-        
-        st.warning("⚠️ **Note:** Some websites (like FSGA) may block cloud servers. If URLs fail here, use the **'📋 Paste Content'** tab instead - it works with any site!")
-        
-        urls_input = st.text_area(
-            "URLs",
-            placeholder="https://www.fsga.org/TournamentCategory/EnterList/...\nhttps://wpga-onlineregistration.golfgenius.com/pages/...\nhttps://usamtour.bluegolf.com/bluegolf/...",
-            height=120,
-            label_visibility="collapsed"
-        )
-        
-        col1, col2 = st.columns([1, 3])
-        with col1:
-            parse_button = st.button("🔍 Extract Data", type="primary", use_container_width=True)
-        with col2:
-            if 'url_results' in st.session_state and st.session_state['url_results'] is not None:
-                clear_button = st.button("🗑️ Clear Results", use_container_width=False)
-                if clear_button:
-                    st.session_state['url_results'] = None
-                    st.session_state['processed_urls'] = []
-                    st.rerun()
-        
-        if parse_button:
-            if not urls_input.strip():
-                st.error("Please enter at least one URL")
-            elif not api_key:
-                st.error("Please enter your OpenAI API key in the sidebar")
-            else:
-                # Parse multiple URLs
-                urls = [url.strip() for url in urls_input.strip().split('\n') if url.strip()]
-                
-                if len(urls) == 0:
-                    st.error("Please enter at least one valid URL")
-                else:
-                    all_results = []
-                    processed_urls = []
-                    
-                    # Progress tracking
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    
-                    for i, url in enumerate(urls):
-                        status_text.text(f"Processing URL {i+1} of {len(urls)}: {url[:50]}...")
-                        progress_bar.progress((i) / len(urls))
-                        
-                        try:
-                            result_df = process_url_with_ai(url, api_key)
-                            
-                            if result_df is not None and len(result_df) > 0:
-                                # Add source URL column
-                                result_df['Source URL'] = url
-                                all_results.append(result_df)
-                                processed_urls.append({'url': url, 'count': len(result_df), 'status': '✅'})
-                                st.success(f"✅ Found {len(result_df)} tournaments from {url[:50]}...")
-                            else:
-                                processed_urls.append({'url': url, 'count': 0, 'status': '⚠️'})
-                                st.warning(f"⚠️ No tournaments found from {url[:50]}...")
-                        except Exception as e:
-                            processed_urls.append({'url': url, 'count': 0, 'status': '❌'})
-                            st.error(f"❌ Error processing {url[:50]}...: {str(e)}")
-                    
-                    progress_bar.progress(1.0)
-                    status_text.text("Processing complete!")
-                    
-                    # Combine all results
-                    if all_results:
-                        combined_df = pd.concat(all_results, ignore_index=True)
-                        st.session_state['url_results'] = combined_df
-                        st.session_state['processed_urls'] = processed_urls
-                        
-                        # Add to combined results in sidebar
-                        if 'combined_results' not in st.session_state:
-                            st.session_state['combined_results'] = pd.DataFrame()
-                        st.session_state['combined_results'] = pd.concat(
-                            [st.session_state['combined_results'], combined_df], 
-                            ignore_index=True
-                        ).drop_duplicates(subset=['Date', 'Name', 'Course'], keep='first')
-                        
-                        total_tournaments = len(combined_df)
-                        st.success(f"🎉 Total: {total_tournaments} tournaments extracted from {len([p for p in processed_urls if p['status'] == '✅'])} URL(s)!")
-                        st.info(f"📦 Added to combined results ({len(st.session_state['combined_results'])} total in sidebar)")
-                    else:
-                        st.error("No tournaments were extracted from any of the URLs.")
-        
-        # Display results
-        if 'url_results' in st.session_state and st.session_state['url_results'] is not None:
-            df = st.session_state['url_results']
-            
-            # Show processing summary if multiple URLs were processed
-            if 'processed_urls' in st.session_state and len(st.session_state['processed_urls']) > 1:
-                with st.expander("📋 Processing Summary", expanded=False):
-                    summary_df = pd.DataFrame(st.session_state['processed_urls'])
-                    summary_df.columns = ['URL', 'Tournaments Found', 'Status']
-                    st.dataframe(summary_df, use_container_width=True)
-            
-            st.markdown("### 📊 Extracted Tournament Data")
-            st.dataframe(df, use_container_width=True, height=400)
-            
-            # Stats
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Tournaments", len(df))
-            with col2:
-                valid_dates = df['Date'].notna().sum()
-                st.metric("Valid Dates", f"{valid_dates}/{len(df)}")
-            with col3:
-                valid_courses = df['Course'].notna().sum()
-                st.metric("Valid Courses", f"{valid_courses}/{len(df)}")
-            with col4:
-                if 'Source URL' in df.columns:
-                    unique_sources = df['Source URL'].nunique()
-                    st.metric("Sources", unique_sources)
-                else:
-                    categories = df['Category'].notna().sum()
-                    st.metric("Categories Found", f"{categories}/{len(df)}")
-            
-            # Download buttons
-            st.markdown("### 📥 Download")
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(get_csv_download_link(df, "tournament_data.csv"), unsafe_allow_html=True)
-            with col2:
-                st.markdown(get_excel_download_link(df, "tournament_data.xlsx"), unsafe_allow_html=True)
+        render_url_tab(api_key)
     
     # --- TAB 2: CSV Upload ---
     with tab2:
-        st.markdown("### Upload a CSV file with tournament data")
-        
-        uploaded_file = st.file_uploader(
-            "Choose a CSV file",
-            type=['csv'],
-            help="Upload a CSV file containing tournament data"
-        )
-        
-        if uploaded_file is not None:
-            try:
-                # Read the CSV file
-                df = pd.read_csv(uploaded_file)
-                
-                # Display original data
-                st.markdown("### 📄 Original Data")
-                st.dataframe(df, use_container_width=True, height=250)
-                
-                # Clean the data
-                with st.spinner("Cleaning data..."):
-                    cleaned_df = clean_tournament_data(df)
-                
-                # Display cleaned data
-                st.markdown("### ✨ Cleaned Data")
-                st.dataframe(cleaned_df, use_container_width=True, height=350)
-                
-                # Stats
-                st.markdown("### 📊 Cleaning Summary")
-                col1, col2, col3, col4 = st.columns(4)
-                
-                with col1:
-                    valid_dates = cleaned_df['Date'].notna().sum()
-                    st.metric("Valid Dates", f"{valid_dates}/{len(cleaned_df)}")
-                
-                with col2:
-                    valid_names = cleaned_df['Name'].notna().sum()
-                    st.metric("Valid Names", f"{valid_names}/{len(cleaned_df)}")
-                
-                with col3:
-                    valid_states = cleaned_df['State'].notna().sum()
-                    st.metric("Valid States", f"{valid_states}/{len(cleaned_df)}")
-                
-                with col4:
-                    valid_categories = cleaned_df['Category'].notna().sum()
-                    st.metric("Categories", f"{valid_categories}/{len(cleaned_df)}")
-                
-                # Add to combined results button
-                st.markdown("### 📦 Add to Combined Results")
-                if st.button("➕ Add to Combined Results", key="add_csv_to_combined", use_container_width=True):
-                    cleaned_df_with_source = cleaned_df.copy()
-                    cleaned_df_with_source['Source'] = uploaded_file.name
-                    
-                    if 'combined_results' not in st.session_state:
-                        st.session_state['combined_results'] = pd.DataFrame()
-                    st.session_state['combined_results'] = pd.concat(
-                        [st.session_state['combined_results'], cleaned_df_with_source], 
-                        ignore_index=True
-                    ).drop_duplicates(subset=['Date', 'Name', 'Course'], keep='first')
-                    st.success(f"✅ Added {len(cleaned_df)} tournaments to combined results ({len(st.session_state['combined_results'])} total)")
-                
-                # Download options
-                st.markdown("### 📥 Download This File Only")
-                col1, col2 = st.columns(2)
-                with col1:
-                    st.markdown(get_csv_download_link(cleaned_df), unsafe_allow_html=True)
-                with col2:
-                    st.markdown(get_excel_download_link(cleaned_df), unsafe_allow_html=True)
-                    
-            except Exception as e:
-                st.error(f"Error processing file: {str(e)}")
-        
-        else:
-            st.info("👆 Upload a CSV file to get started")
-            
-            with st.expander("📋 See example CSV format"):
-                sample_data = pd.DataFrame({
-                    'Date': ['5/15/2025', 'June 3, 2025', '2025-07-20'],
-                    'Name': ['Senior Championship *FULL*', 'Junior Open', "Women's Amateur Classic"],
-                    'Course': ['Pine Valley GC', 'Augusta National Golf Club', 'Pebble Beach'],
-                    'Category': ['', '', ''],
-                    'City': ['Clementon', 'Augusta', 'Pebble Beach'],
-                    'State': ['New Jersey', 'GA', 'California'],
-                    'Zip': ['08021', '30904', '93953']
-                })
-                st.dataframe(sample_data, use_container_width=True)
+        render_csv_tab()
     
     # --- TAB 3: Paste Content ---
     with tab3:
-        st.markdown("### Paste content from a protected page")
-        st.markdown("*For pages that require login (like Golf Genius), simply copy the visible text or HTML and paste it here.*")
-        
-        st.info("""
-        **How to copy content:**
-        - **Easy way:** Select all visible text on the page (Cmd+A / Ctrl+A) and copy (Cmd+C / Ctrl+C)
-        - **Alternative:** Right-click → View Page Source, then copy all HTML
-        
-        Both formats work! The AI will extract tournament data from whatever you paste.
-        """)
-        
-        # Optional: source URL for state/category inference
-        source_url_input = st.text_input(
-            "Source URL (optional)",
-            placeholder="https://www.golfgenius.com/leagues/36562/...",
-            help="Enter the original URL to help infer state and category"
-        )
-        
-        html_input = st.text_area(
-            "Paste content here",
-            placeholder="Paste tournament listings here...\n\nExample:\n44th Alabama State Four-Ball Championship\nWed, Apr 29, 2026 - Sat, May 2, 2026\nCourse: Canebrake Club\n...",
-            height=250,
-            label_visibility="collapsed"
-        )
-        
-        col1, col2 = st.columns([1, 3])
-        with col1:
-            parse_html_button = st.button("🔍 Extract Data", type="primary", use_container_width=True, key="parse_html")
-        with col2:
-            if 'html_results' in st.session_state and st.session_state['html_results'] is not None:
-                clear_html_button = st.button("🗑️ Clear Results", use_container_width=False, key="clear_html")
-                if clear_html_button:
-                    st.session_state['html_results'] = None
-                    st.rerun()
-        
-        if parse_html_button:
-            if not html_input.strip():
-                st.error("Please paste content")
-            elif not api_key:
-                st.error("Please enter your OpenAI API key in the sidebar")
-            elif len(html_input) < 100:
-                st.error("Content seems too short. Make sure you copied enough text.")
-            else:
-                try:
-                    # Determine if it's HTML or plain text
-                    is_html = html_input.strip().startswith('<') or '<html' in html_input.lower() or '<div' in html_input.lower()
-                    
-                    if is_html:
-                        # Extract text from HTML
-                        with st.spinner("Extracting content from HTML..."):
-                            text_content = extract_text_from_html(html_input)
-                    else:
-                        # Use the text directly
-                        text_content = html_input.strip()
-                    
-                    if not text_content or len(text_content) < 50:
-                        st.warning("Could not extract meaningful content.")
-                    else:
-                        st.success(f"Processing {len(text_content)} characters of content...")
-                        
-                        # Parse with AI
-                        with st.spinner("AI is analyzing the content..."):
-                            tournaments = parse_tournaments_with_ai(text_content, api_key)
-                            
-                            if not tournaments:
-                                st.warning("No tournaments found in the content.")
-                            else:
-                                # Convert to DataFrame and clean
-                                df = pd.DataFrame(tournaments)
-                                cleaned_df = clean_tournament_data(df)
-                                
-                                # Apply URL-based defaults if source URL provided
-                                if source_url_input.strip():
-                                    cleaned_df = apply_url_based_defaults(cleaned_df, source_url=source_url_input.strip())
-                                else:
-                                    cleaned_df = apply_url_based_defaults(cleaned_df)
-                                
-                                # Filter old dates
-                                cleaned_df = filter_old_dates(cleaned_df, raw_text_content=text_content)
-                                
-                                # Add source info
-                                if source_url_input.strip():
-                                    cleaned_df['Source URL'] = source_url_input.strip()
-                                else:
-                                    cleaned_df['Source'] = 'Pasted Content'
-                                
-                                st.session_state['html_results'] = cleaned_df
-                                
-                                # Add to combined results
-                                if 'combined_results' not in st.session_state:
-                                    st.session_state['combined_results'] = pd.DataFrame()
-                                st.session_state['combined_results'] = pd.concat(
-                                    [st.session_state['combined_results'], cleaned_df], 
-                                    ignore_index=True
-                                ).drop_duplicates(subset=['Date', 'Name', 'Course'], keep='first')
-                                
-                                st.success(f"🎉 Found {len(cleaned_df)} tournaments!")
-                                st.info(f"📦 Added to combined results ({len(st.session_state['combined_results'])} total in sidebar)")
-                            
-                except Exception as e:
-                    st.error(f"Error processing content: {str(e)}")
-        
-        # Display results
-        if 'html_results' in st.session_state and st.session_state['html_results'] is not None:
-            df = st.session_state['html_results']
-            
-            st.markdown("### 📊 Extracted Tournament Data")
-            st.dataframe(df, use_container_width=True, height=400)
-            
-            # Stats
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Total Tournaments", len(df))
-            with col2:
-                valid_dates = df['Date'].notna().sum()
-                st.metric("Valid Dates", f"{valid_dates}/{len(df)}")
-            with col3:
-                valid_courses = df['Course'].notna().sum()
-                st.metric("Valid Courses", f"{valid_courses}/{len(df)}")
-            with col4:
-                valid_states = df['State'].notna().sum()
-                st.metric("Valid States", f"{valid_states}/{len(df)}")
-            
-            # Download buttons
-            st.markdown("### 📥 Download")
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(get_csv_download_link(df, "tournament_data_from_html.csv"), unsafe_allow_html=True)
-            with col2:
-                st.markdown(get_excel_download_link(df, "tournament_data_from_html.xlsx"), unsafe_allow_html=True)
+        render_paste_tab(api_key)
 
 
 if __name__ == "__main__":